@@ -1,10 +1,20 @@
 """Main entry point for the CodeSecTools application."""
 
-from typer.main import get_command
+from typing import Any
 
 from codesectools.cli import cli
 
-click_cli = get_command(cli)
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Build the Click command (used by the documentation) on first access."""
+    if name == "click_cli":
+        from typer.main import get_command
+
+        global click_cli
+        click_cli = get_command(cli)
+        return click_cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     cli()
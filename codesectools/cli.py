@@ -1,7 +1,8 @@
 """Defines the main command-line interface (CLI) for CodeSecTools.
 
 This script sets up the main entry point for the application using `typer`.
-It dynamically discovers and adds CLI commands from all available SAST tools.
+It dynamically discovers and adds CLI commands from all available SAST tools,
+which are only built when they are invoked.
 """
 
 import os
@@ -10,10 +11,9 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import typer.completion
 import typer.core
-from click import Choice
-from rich import print
+import typer.main
+from click import Command, Context
 from typing_extensions import Annotated
 
 from codesectools.datasets import DATASETS_ALL
@@ -22,18 +22,51 @@ from codesectools.sasts import SASTS_ALL
 from codesectools.sasts.all.cli import build_cli as build_all_sast_cli
 from codesectools.sasts.core.sast.requirements import DownloadableRequirement
 
-typer.completion.completion_init()
-
 CLI_NAME = "cstools"
 
+# Shell completion classes are only needed when the shell asks for completions
+if f"_{CLI_NAME.upper()}_COMPLETE" in os.environ:
+    import typer.completion
+
+    typer.completion.completion_init()
+
 COMPLETION_FILE = [
     Path.home() / ".bash_completions" / f"{CLI_NAME}.sh",
     Path.home() / f".zfunc/_{CLI_NAME}",
     Path.home() / f".config/fish/completions/{CLI_NAME}.fish",
 ]
 
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    """A `TyperGroup` deferring the build of SAST subcommands until they are needed.
+
+    The SAST subcommand names are known from the SAST tools directory, but
+    importing a SAST tool and building its CLI is only done when its command
+    is looked up (e.g. when it is invoked or when the root help is displayed).
+
+    Attributes:
+        sast_commands (dict[str, str]): A mapping of subcommand names to SAST tool names.
+
+    """
+
+    sast_commands = {sast_name.lower(): sast_name for sast_name in SASTS_ALL}
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        """Return the names of the eager commands followed by the SAST subcommands."""
+        return super().list_commands(ctx) + list(self.sast_commands)
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+        """Build and register a SAST subcommand on first lookup."""
+        if cmd_name in self.sast_commands and cmd_name not in self.commands:
+            sast_name = self.sast_commands[cmd_name]
+            sast_cli = SASTS_ALL[sast_name]["cli_factory"].build_cli()
+            self.add_command(typer.main.get_group(sast_cli), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 cli = typer.Typer(
     name=CLI_NAME,
+    cls=LazyTyperGroup,
     no_args_is_help=True,
     add_help_option=False,
     add_completion=not any(f.is_file() for f in COMPLETION_FILE),
@@ -42,9 +75,11 @@ cli = typer.Typer(
 
 def version_callback(value: bool) -> None:
     """Print the application version and exit."""
-    import importlib.metadata
-
     if value:
+        import importlib.metadata
+
+        from rich import print
+
         print(importlib.metadata.version("codesectools"))
         raise typer.Exit()
 
@@ -83,6 +118,7 @@ def status(
     ] = False,
 ) -> None:
     """Display the availability of SAST tools and datasets."""
+    from rich import print
     from rich.table import Table
 
     if sasts or (not sasts and not datasets):
@@ -159,69 +195,84 @@ def get_downloadable() -> dict[str, DownloadableRequirement | Dataset]:
                     downloadable[req.name] = req
 
     for dataset_name, dataset in DATASETS_ALL.items():
-        dataset_instance = dataset()
         if not dataset.is_cached():
-            downloadable[dataset_name] = dataset_instance
+            downloadable[dataset_name] = dataset()
 
     return downloadable
 
 
-if DOWNLOADABLE := get_downloadable():
-    download_hidden = False
-    download_arg_type = str
-    download_arg_value = typer.Argument(
-        click_type=Choice(["all"] + list(DOWNLOADABLE)),
-        metavar="NAME",
-    )
-else:
-    download_hidden = True
-    download_arg_type = Optional[str]
-    download_arg_value = None
+def complete_downloadable(incomplete: str) -> list[str]:
+    """Return the names of the downloadable resources matching the incomplete value."""
+    return [
+        name for name in ["all", *get_downloadable()] if name.startswith(incomplete)
+    ]
 
 
-@cli.command(hidden=download_hidden)
+@cli.command()
 def download(
-    name: download_arg_type = download_arg_value,
+    name: Annotated[
+        Optional[str],
+        typer.Argument(
+            metavar="NAME",
+            show_default=False,
+            autocompletion=complete_downloadable,
+        ),
+    ] = None,
     test: Annotated[bool, typer.Option(hidden=True)] = False,
 ) -> None:
     """Download and install any missing resources that are available for download."""
-    if name is None:
+    from rich import print
+
+    downloadable = get_downloadable()
+    if not downloadable:
         print("All downloadable resources have been retrieved.")
+        return
+
+    choices = ["all", *downloadable]
+    if name not in choices:
+        valid_names = ", ".join(map(repr, choices))
+        message = (
+            f"{name!r} is not one of {valid_names}."
+            if name is not None
+            else f"Missing resource name, choose from {valid_names}."
+        )
+        raise typer.BadParameter(message, param_hint="'NAME'")
+
+    if name == "all":
+        targets = downloadable.values()
     else:
-        if name == "all":
-            targets = DOWNLOADABLE.values()
-        else:
-            targets = [DOWNLOADABLE[name]]
+        targets = [downloadable[name]]
 
-        for downloadable in targets:
-            if isinstance(downloadable, DownloadableRequirement):
-                downloadable.download()
-            else:
-                downloadable.download_dataset(test=test)
+    for target in targets:
+        if isinstance(target, DownloadableRequirement):
+            target.download()
+        else:
+            target.download_dataset(test=test)
 
 
 cli.add_typer(build_all_sast_cli())
 
-if shutil.which("docker"):
-
-    @cli.command()
-    def docker(
-        target: Annotated[
-            Path, typer.Option(help="The directory to mount inside the container.")
-        ] = Path("."),
-        isolation: Annotated[
-            bool,
-            typer.Option(
-                help="Enable network isolation for the container (disables host network sharing)."
-            ),
-        ] = False,
-    ) -> None:
-        """Start the Docker environment for the specified target (current directory by default)."""
-        from codesectools.shared.docker import AnalysisEnvironment
-
-        env = AnalysisEnvironment(isolation=isolation)
-        env.start(target=target.resolve())
-
-
-for _, sast_data in SASTS_ALL.items():
-    cli.add_typer(sast_data["cli_factory"].build_cli())
+
+@cli.command()
+def docker(
+    target: Annotated[
+        Path, typer.Option(help="The directory to mount inside the container.")
+    ] = Path("."),
+    isolation: Annotated[
+        bool,
+        typer.Option(
+            help="Enable network isolation for the container (disables host network sharing)."
+        ),
+    ] = False,
+) -> None:
+    """Start the Docker environment for the specified target (current directory by default)."""
+    from rich import print
+
+    if not shutil.which("docker"):
+        print("[red]Docker is not installed or not in PATH.[/red]")
+        raise typer.Exit(code=1)
+
+    from codesectools.shared.docker import AnalysisEnvironment
+
+    env = AnalysisEnvironment(isolation=isolation)
+    env.start(target=target.resolve())
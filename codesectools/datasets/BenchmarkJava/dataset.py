@@ -6,13 +6,15 @@ from a Git repository and associates test files with expected results from a CSV
 """
 
 import csv
+import os
 import random
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Self
 
 from codesectools.datasets.core.dataset import File, PrebuiltFileDataset
 from codesectools.shared.cwe import CWE, CWEs
-from codesectools.utils import CPU_COUNT
+from codesectools.utils import CPU_COUNT, read_files
 
 
 class TestCode(File):
@@ -23,6 +25,8 @@ class TestCode(File):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         filepath: Path,
@@ -91,17 +95,24 @@ class BenchmarkJava(PrebuiltFileDataset):
             True if the names are equal, False otherwise.
 
         """
-        if isinstance(other, str):
+        if self is other:
+            return True
+        elif isinstance(other, str):
             return self.name == other
         elif isinstance(other, self.__class__):
             return self.name == other.name
         else:
             return False
 
+    def __hash__(self) -> int:
+        """Return the hash of the dataset, based on its name."""
+        return hash(self.name)
+
     def download_files(self: Self, test: bool = False) -> None:
         """Download the dataset files from the official Git repository.
 
         Clones the BenchmarkJava repository and, if in test mode, prunes it to a smaller size.
+        Only the latest commit is needed: its history is not downloaded.
 
         Args:
             test: If True, reduce the number of test files for faster testing.
@@ -110,30 +121,32 @@ class BenchmarkJava(PrebuiltFileDataset):
         from git import Repo
 
         Repo.clone_from(
-            "https://github.com/OWASP-Benchmark/BenchmarkJava.git", self.directory
+            "https://github.com/OWASP-Benchmark/BenchmarkJava.git",
+            self.directory,
+            depth=1,
+            no_tags=True,
         )
 
         if test:
-            testcodes = list(
-                (
-                    self.directory / "src/main/java/org/owasp/benchmark/testcode"
-                ).iterdir()
-            )
-            for to_delete_testcode in random.sample(testcodes, k=len(testcodes) - 50):
-                to_delete_testcode.unlink()
-
-    def load_dataset(self) -> list[File]:
+            testcode_dir = self.directory / "src/main/java/org/owasp/benchmark/testcode"
+            with os.scandir(testcode_dir) as entries:
+                testcodes = [entry.path for entry in entries if entry.is_file()]
+            kept = set(random.sample(range(len(testcodes)), k=min(50, len(testcodes))))
+            for i, testcode in enumerate(testcodes):
+                if i not in kept:
+                    os.unlink(testcode)
+
+    def load_dataset(self) -> Iterator[File]:
         """Load the BenchmarkJava dataset from its source files.
 
         Reads a CSV file for vulnerability metadata and the corresponding Java
         source files from the cloned repository. It creates a `TestCode` object
         for each entry.
 
-        Returns:
-            A list of `TestCode` objects representing the dataset.
+        Yields:
+            The `TestCode` objects representing the dataset.
 
         """
-        files = []
         testcode_dir = (
             self.directory
             / "src"
@@ -144,22 +157,27 @@ class BenchmarkJava(PrebuiltFileDataset):
             / "benchmark"
             / "testcode"
         )
-        reader = csv.reader((self.directory / "expectedresults-1.2.csv").open())
-        next(reader)
-        for row in reader:
-            filename = f"{row[0]}.java"
-            filepath = testcode_dir / filename
-            if filepath.is_file():
-                content = filepath.read_bytes()
-                cwes = [CWEs.from_id(int(row[3]))]
-                has_vuln = True if row[2] == "true" else False
-                files.append(
-                    TestCode(
-                        filepath.relative_to(self.directory),
-                        content,
-                        cwes,
-                        has_vuln,
-                    )
-                )
-
-        return files
+        with os.scandir(testcode_dir) as entries:
+            filenames = {entry.name for entry in entries}
+
+        testcodes = []
+        with (self.directory / "expectedresults-1.2.csv").open() as f:
+            reader = csv.reader(f)
+            next(reader)
+            for row in reader:
+                filename = f"{row[0]}.java"
+                if filename in filenames:
+                    cwes = [CWEs.from_id(int(row[3]))]
+                    has_vuln = True if row[2] == "true" else False
+                    testcodes.append((testcode_dir / filename, cwes, has_vuln))
+
+        contents = read_files([filepath for filepath, _, _ in testcodes])
+        for (filepath, cwes, has_vuln), content in zip(
+            testcodes, contents, strict=True
+        ):
+            yield TestCode(
+                filepath.relative_to(self.directory),
+                content,
+                cwes,
+                has_vuln,
+            )
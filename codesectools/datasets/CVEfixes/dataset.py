@@ -5,14 +5,37 @@ is composed of Git repositories at commits just before a CVE-related fix.
 It reads repository information from a CSV file.
 """
 
+import ast
 import csv
+import shutil
+from collections.abc import Iterator
 from typing import Self
 
-from codesectools.datasets.core.dataset import File, GitRepo, GitRepoDataset
+from codesectools.datasets.core.dataset import GitRepo, GitRepoDataset
 from codesectools.shared.cwe import CWEs
 from codesectools.utils import DATA_DIR
 
 
+def first_parent(parents: str) -> str:
+    """Get the first commit of a `parents` field formatted as a Python list.
+
+    The field is almost always a list of quoted commit hashes, which is sliced
+    directly, other formats are parsed as a literal.
+
+    Args:
+        parents: The `parents` field, e.g. "['<sha>']".
+
+    Returns:
+        The first parent commit hash.
+
+    """
+    _, quote, rest = parents.partition("'")
+    commit = rest.partition("'")[0]
+    if quote and commit.isalnum():
+        return commit
+    return ast.literal_eval(parents)[0]
+
+
 class CVEfixes(GitRepoDataset):
     """Represents the CVEfixes dataset.
 
@@ -24,11 +47,17 @@ class CVEfixes(GitRepoDataset):
         supported_languages (list[str]): A list of supported languages.
         max_repo_size (int): The maximum size of a repository (in bytes) to be
             included in the analysis.
+        sparse_patterns (dict[str, list[str]]): Patterns of the files to check
+            out for each language (sources and build files), for the SAST
+            tools with a sparse checkout.
 
     """
 
     name = "CVEfixes"
     supported_languages = ["java"]
+    sparse_patterns = {
+        "java": ["*.java", "pom.xml", "*.gradle", "*.gradle.kts"],
+    }
     license = "CC BY 4.0"
     license_url = "https://creativecommons.org/licenses/by/4.0/"
 
@@ -46,38 +75,46 @@ class CVEfixes(GitRepoDataset):
         """Copy the dataset files from the package data directory to the user cache."""
         self.directory.mkdir(exist_ok=True, parents=True)
         license_file = DATA_DIR / self.name / "LICENSE"
-        (self.directory / license_file.name).write_bytes(license_file.read_bytes())
+        shutil.copyfile(license_file, self.directory / license_file.name)
 
         for dataset_file in (DATA_DIR / self.name).glob("CVEfixes_*.csv"):
-            (self.directory / dataset_file.name).write_bytes(dataset_file.read_bytes())
+            shutil.copyfile(dataset_file, self.directory / dataset_file.name)
 
     def load_dataset(
         self,
-    ) -> list[File]:
+    ) -> Iterator[GitRepo]:
         """Load the CVEfixes dataset from its source CSV file.
 
         Parses a CSV file containing information about CVEs, repositories,
         commits, and vulnerable files to create a list of `GitRepo` objects.
 
-        Returns:
-            A list of `GitRepo` objects representing the dataset, filtered by
+        Yields:
+            The `GitRepo` objects representing the dataset, filtered by
             repository size.
 
         """
         dataset_path = self.directory / f"CVEfixes_{self.lang}.csv"
-        repos = []
         with open(dataset_path, newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
+            # Index the needed columns instead of building a dict per row
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            cve_id_index = header.index("cve_id")
+            repo_url_index = header.index("repo_url")
+            parents_index = header.index("parents")
+            repo_size_index = header.index("repo_size")
+            cwe_ids_index = header.index("cwe_ids")
+            filenames_index = header.index("filenames")
             for row in reader:
-                name = row["cve_id"]
-                url = row["repo_url"]
-                commit = eval(row["parents"])[0]
-                size = int(row["repo_size"])
+                # Skip large repositories before parsing the rest of the row
+                size = int(row[repo_size_index])
+                if size >= self.max_repo_size:
+                    continue
+
+                name = row[cve_id_index]
+                url = row[repo_url_index]
+                commit = first_parent(row[parents_index])
                 cwes = [
-                    CWEs.from_string(cwe_id) for cwe_id in row["cwe_ids"].split(";")
+                    CWEs.from_string(cwe_id) for cwe_id in row[cwe_ids_index].split(";")
                 ]
-                files = row["filenames"].split(";")
-                repo = GitRepo(name, url, commit, size, cwes, files, has_vuln=True)
-                if repo.size < self.max_repo_size:
-                    repos.append(repo)
-        return repos
+                files = row[filenames_index].split(";")
+                yield GitRepo(name, url, commit, size, cwes, files, has_vuln=True)
@@ -7,20 +7,27 @@ to associate test files with expected results.
 """
 
 import io
+import os
 import re
 import shutil
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Self
 
 from codesectools.datasets.core.dataset import File, PrebuiltFileDataset
 from codesectools.shared.cwe import CWE, CWEs
-from codesectools.utils import CPU_COUNT
+from codesectools.utils import CPU_COUNT, read_files
+
+# Compiled once, this is matched for every flaw of the manifest
+FLAW_CWE_PATTERN = re.compile(r"CWE-(\d+)")
 
 
 class TestCode(File):
     """Represents a single test file in the JulietTestSuiteC dataset."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         filepath: Path,
@@ -79,13 +86,19 @@ class JulietTestSuiteC(PrebuiltFileDataset):
             True if the names are equal, False otherwise.
 
         """
-        if isinstance(other, str):
+        if self is other:
+            return True
+        elif isinstance(other, str):
             return self.name == other
         elif isinstance(other, self.__class__):
             return self.name == other.name
         else:
             return False
 
+    def __hash__(self) -> int:
+        """Return the hash of the dataset, based on its name."""
+        return hash(self.name)
+
     def download_files(self: Self, test: bool = False) -> None:
         """Download and extract the dataset from the NIST SARD website.
 
@@ -118,44 +131,50 @@ class JulietTestSuiteC(PrebuiltFileDataset):
                 if not cwe_dir.name.startswith("CWE835"):
                     shutil.rmtree(cwe_dir)
 
-    def load_dataset(self) -> list[File]:
+    def load_dataset(self) -> Iterator[File]:
         """Load the JulietTestSuiteC dataset from the source files.
 
         Parses the `manifest.xml` file to identify vulnerabilities in the C/C++
         source files and creates a `TestCode` object for each file containing a flaw.
 
-        Returns:
-            A list of `TestCode` objects representing the dataset.
+        Yields:
+            The `TestCode` objects representing the dataset.
 
         """
         from lxml import etree
 
-        files = []
-        testcode_dir = self.directory / "C" / "testcases"
-        testcode_paths = {
-            path.name: path
-            for path in list(testcode_dir.rglob("CWE*.c"))
-            + list(testcode_dir.rglob("CWE*.cpp"))
+        # Index the source files by name in a single walk of the test cases
+        testcode_dirs = {
+            filename: dirpath
+            for dirpath, _, filenames in os.walk(self.directory / "C" / "testcases")
+            for filename in filenames
+            if filename.startswith("CWE") and filename.endswith((".c", ".cpp"))
         }
         manifest_path = self.directory / "C" / "manifest.xml"
-        manifest = etree.parse(manifest_path)
-        testcases = manifest.xpath("/container/testcase")
-        for testcase in testcases:
-            files_tree = testcase.xpath("file")
-            for file_tree in files_tree:
+        flawed_files = []
+        # Stream the manifest one test case at a time instead of building its whole tree
+        for _, testcase in etree.iterparse(manifest_path, tag="testcase"):
+            for file_tree in testcase.iterfind("file"):
                 file_path = file_tree.get("path")
-                if file_obj := testcode_paths.get(file_path):
-                    if file_tree.xpath("flaw"):
-                        flaw = file_tree.xpath("flaw")[0]
+                if dirpath := testcode_dirs.get(file_path):
+                    flaw = file_tree.find("flaw")
+                    if flaw is not None:
                         flaw_name = flaw.get("name")
-                        if m := re.search(r"CWE-(\d+)", flaw_name):
-                            cwe_id = int(m.group(1))
-                            files.append(
-                                TestCode(
-                                    filepath=file_obj.relative_to(self.directory),
-                                    content=file_obj.read_bytes(),
-                                    cwes=[CWEs.from_id(cwe_id)],
-                                    has_vuln=True,
-                                )
+                        if m := FLAW_CWE_PATTERN.search(flaw_name):
+                            flawed_files.append(
+                                (Path(dirpath, file_path), int(m.group(1)))
                             )
-        return files
+
+            # Free the processed test cases
+            testcase.clear()
+            while testcase.getprevious() is not None:
+                del testcase.getparent()[0]
+
+        contents = read_files([file_obj for file_obj, _ in flawed_files])
+        for (file_obj, cwe_id), content in zip(flawed_files, contents, strict=True):
+            yield TestCode(
+                filepath=file_obj.relative_to(self.directory),
+                content=content,
+                cwes=[CWEs.from_id(cwe_id)],
+                has_vuln=True,
+            )
@@ -4,6 +4,7 @@ This module iterates through the subdirectories of the `codesectools/datasets`
 directory. For each subdirectory that represents a dataset (i.e., contains a
 `dataset.py` file and is not the `core` directory), it dynamically imports
 the dataset module and adds the dataset class to the `DATASETS_ALL` dictionary.
+The dataset class, and its `name`, must be the name of the subdirectory.
 
 Attributes:
     DATASETS_ALL (dict): A dictionary mapping dataset names to their
@@ -12,15 +13,18 @@ Attributes:
 """
 
 import importlib
+import os
 from typing import Any, Type
 
-from codesectools.datasets.core.dataset import Dataset
+from codesectools.datasets.core.dataset import Dataset, is_dataset_cached
 from codesectools.utils import DATASETS_DIR
 
 
 class LazyDatasetLoader:
     """Lazily load a dataset class to avoid premature imports."""
 
+    __slots__ = ("name", "loaded", "dataset_module", "dataset")
+
     def __init__(self, name: str) -> None:
         """Initialize the lazy loader.
 
@@ -38,9 +42,24 @@ class LazyDatasetLoader:
                 f"codesectools.datasets.{self.name}.dataset"
             )
             self.dataset: Type[Dataset] = getattr(self.dataset_module, self.name)
+            # The cache status is checked by name before the class is loaded
+            assert self.dataset.name == self.name, (
+                f"Dataset class {self.name} must be named {self.name!r}"
+            )
 
             self.loaded = True
 
+    def is_cached(self) -> bool:
+        """Check if the dataset is cached locally, without importing its module.
+
+        Returns:
+            True if the dataset is cached, False otherwise.
+
+        """
+        if self.loaded:
+            return self.dataset.is_cached()
+        return is_dataset_cached(self.name)
+
     def __call__(self, *args: Any, **kwargs: Any) -> Dataset:
         """Create an instance of the loaded dataset class."""
         self._load()
@@ -53,11 +72,12 @@ class LazyDatasetLoader:
 
 
 DATASETS_ALL = {}
-for child in DATASETS_DIR.iterdir():
-    if child.is_dir():
-        if list(child.glob("dataset.py")) and child.name != "core":
-            dataset_name = child.name
+with os.scandir(DATASETS_DIR) as entries:
+    for child in entries:
+        if child.is_dir() and child.name != "core":
+            if os.path.isfile(os.path.join(child.path, "dataset.py")):
+                dataset_name = child.name
 
-            DATASETS_ALL[dataset_name] = LazyDatasetLoader(dataset_name)
+                DATASETS_ALL[dataset_name] = LazyDatasetLoader(dataset_name)
 
 DATASETS_ALL = dict(sorted(DATASETS_ALL.items()))
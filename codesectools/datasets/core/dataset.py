@@ -19,10 +19,72 @@ from rich import print
 from codesectools.utils import USER_CACHE_DIR
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from git import Repo
+
     from codesectools.sasts.core.parser import AnalysisResult, Defect
     from codesectools.shared.cwe import CWE
 
 
+def is_dataset_cached(name: str) -> bool:
+    """Check if a dataset has been downloaded and is cached locally.
+
+    Args:
+        name: The name of the dataset.
+
+    Returns:
+        True if the dataset is cached, False otherwise.
+
+    """
+    return (USER_CACHE_DIR / name / ".complete").is_file()
+
+
+def copy_borrowed_objects(repo: Repo, objects_dir: Path) -> None:
+    """Copy the objects that a clone borrowed from another object directory.
+
+    Only the blobs of the checked out files missing from the clone are copied.
+    The whole repository is repacked only if the checked out commit itself was
+    borrowed.
+
+    Args:
+        repo: The clone, which no longer lists `objects_dir` in its alternates.
+        objects_dir: The object directory the clone borrowed objects from.
+
+    """
+    import tempfile
+
+    from git.exc import GitCommandError
+
+    borrowed_env = {"GIT_ALTERNATE_OBJECT_DIRECTORIES": str(objects_dir)}
+    try:
+        # Missing objects are listed rather than fetched from the remote
+        objects = repo.git.rev_list("--objects", "--missing=print", "HEAD")
+    except GitCommandError:
+        # The commit itself was borrowed, and so were all of its objects
+        repo.git.repack("-a", "-d", env=borrowed_env)
+        return
+
+    missing = {line[1:] for line in objects.splitlines() if line.startswith("?")}
+    # Files skipped by a sparse checkout ("S" entries) were never needed
+    borrowed = []
+    for entry in repo.git.ls_files("--stage", "-t").splitlines():
+        status, _, object_id, _ = entry.split(maxsplit=3)
+        if status == "H" and object_id in missing:
+            borrowed.append(object_id)
+    if not borrowed:
+        return
+
+    with tempfile.TemporaryFile() as object_ids:
+        object_ids.write("".join(f"{object_id}\n" for object_id in borrowed).encode())
+        object_ids.seek(0)
+        repo.git.pack_objects(
+            Path(repo.git_dir, "objects", "pack", "pack"),
+            istream=object_ids,
+            env=borrowed_env,
+        )
+
+
 class Dataset(ABC):
     """Abstract base class for all datasets.
 
@@ -54,18 +116,33 @@ class Dataset(ABC):
         """
         self.directory = USER_CACHE_DIR / self.name
         self.lang = lang
-        self._files = []
+        self._files: list | None = None
         if self.lang:
             self.full_name = f"{self.name}_{self.lang}"
             assert self.full_name in self.list_dataset_full_names()
 
     @property
     def files(self) -> list:
-        """Get the list of dataset files, loading them if necessary."""
-        if self.lang:
-            self._files = self.load_dataset()
+        """Get the list of dataset files, loading them on first access."""
+        if not self.lang:
+            return []
+        if self._files is None:
+            self._files = list(self.load_dataset())
         return self._files
 
+    def __iter__(self) -> Iterator:
+        """Iterate over the dataset units.
+
+        Units are streamed from `load_dataset` unless they have already been
+        loaded by accessing `files`, so single-pass consumers do not hold the
+        whole dataset in memory.
+        """
+        if not self.lang:
+            return iter(())
+        if self._files is not None:
+            return iter(self._files)
+        return iter(self.load_dataset())
+
     @classmethod
     def is_cached(cls) -> bool:
         """Check if the dataset has been downloaded and is cached locally.
@@ -74,8 +151,7 @@ class Dataset(ABC):
             True if the dataset is cached, False otherwise.
 
         """
-        is_complete = USER_CACHE_DIR / cls.name / ".complete"
-        return is_complete.is_file()
+        return is_dataset_cached(cls.name)
 
     def prompt_license_agreement(self) -> None:
         """Display the dataset's license and prompt the user for agreement."""
@@ -131,14 +207,14 @@ By proceeding, you agree to abide by its terms.""",
         print(f"[b]{self.name}[/b] has been downloaded at {self.directory}.")
 
     @abstractmethod
-    def load_dataset(self) -> list[File]:
-        """Load the dataset into memory.
+    def load_dataset(self) -> Iterator[DatasetUnit]:
+        """Load the dataset units one by one.
 
         This method must be implemented by subclasses to define how the
         dataset's contents are loaded.
 
-        Returns:
-            A list of `File` objects representing the dataset.
+        Yields:
+            The `DatasetUnit` objects (e.g. `File` or `GitRepo`) of the dataset.
 
         """
         pass
@@ -196,7 +272,8 @@ class DatasetUnit:
     Serves as a marker class for items like `File` or `GitRepo`.
     """
 
-    pass
+    # Datasets can hold many units, subclasses declare their own slots
+    __slots__ = ()
 
 
 class BenchmarkData:
@@ -221,6 +298,8 @@ class File(DatasetUnit):
 
     """
 
+    __slots__ = ("filepath", "filename", "content", "cwes", "has_vuln")
+
     def __init__(
         self, filepath: Path, content: bytes, cwes: list[CWE], has_vuln: bool
     ) -> None:
@@ -308,10 +387,15 @@ class FileDataset(Dataset):
             A `FileDatasetData` object containing the validation metrics.
 
         """
-        # 1. Prepare ground truth from all files in the dataset
-        ground_truth: dict[str, tuple[bool, set[CWE]]] = {
-            str(file.filepath): (file.has_vuln, set(file.cwes)) for file in self.files
-        }
+        # 1. Prepare ground truth from all files in the dataset, in a single pass
+        ground_truth: dict[str, tuple[bool, set[CWE]]] = {}
+        cwes_list: list[CWE] = []
+        file_number = 0
+        for file in self:
+            ground_truth[str(file.filepath)] = (file.has_vuln, set(file.cwes))
+            if file.has_vuln:
+                cwes_list.extend(file.cwes)
+            file_number += 1
 
         # 2. Process reported defects to get unique (file, cwe) pairs
         # and keep one original Defect object for each to retain metadata.
@@ -352,9 +436,7 @@ class FileDataset(Dataset):
         fn_defects = list(fn_defects_set)
 
         # 6. Prepare data for the result object
-        file_number = len(self.files)
         defect_number = len(analysis_result.defects)
-        cwes_list = [cwe for file in self.files if file.has_vuln for cwe in file.cwes]
 
         tp_cwes = [cwe for _, cwe in tp_defects_map.keys()]
         fp_cwes = [cwe for _, cwe in fp_defects_map.keys()]
@@ -464,6 +546,8 @@ class GitRepo(DatasetUnit):
 
     """
 
+    __slots__ = ("name", "url", "commit", "size", "cwes", "files", "has_vuln")
+
     def __init__(
         self,
         name: str,
@@ -528,18 +612,67 @@ class GitRepo(DatasetUnit):
         else:
             return False
 
-    def save(self, dir: Path) -> None:
+    def save(
+        self,
+        dir: Path,
+        sparse_patterns: list[str] | None = None,
+        reference: Path | None = None,
+    ) -> None:
         """Clone the repository and check out the specific commit.
 
+        The repository is cloned shallowly and without blobs (partial clone),
+        only the files of the analyzed commit are downloaded.
+
         Args:
             dir: The path to the directory where the repository should be cloned.
+            sparse_patterns: Optional gitignore-like patterns restricting the
+                checked out files (the vulnerable files are always included).
+            reference: Optional path to another clone of the same repository,
+                whose objects are reused instead of being downloaded again.
 
         """
         from git import Repo
-
-        repo = Repo.clone_from(self.url, dir)
+        from git.exc import GitCommandError
+
+        repo = Repo.init(dir)
+        alternates = Path(repo.git_dir, "objects", "info", "alternates")
+        if reference is not None:
+            alternates.write_text(f"{reference / '.git' / 'objects'}\n")
+        # Never wait for credentials on unavailable repositories
+        repo.git.update_environment(GIT_TERMINAL_PROMPT="0")
+        # Configure the remote in-process rather than spawning git remote add
+        with repo.config_writer() as config:
+            config.set_value('remote "origin"', "url", self.url)
+        try:
+            # Only the analyzed commit is needed: skip its history, and let
+            # the checkout download the blobs it actually uses
+            repo.git.fetch(
+                "--depth=1", "--filter=blob:none", "--no-tags", "origin", self.commit
+            )
+        except GitCommandError:
+            # Some servers do not allow fetching a commit by its hash, nor
+            # the blobs missing from a partial clone: fetch all branches
+            # completely, as a regular clone does
+            with repo.config_writer() as config:
+                config.remove_option('remote "origin"', "promisor")
+                config.remove_option('remote "origin"', "partialclonefilter")
+            repo.git.fetch("--no-tags", "origin", "+refs/heads/*:refs/remotes/origin/*")
+        if sparse_patterns:
+            try:
+                repo.git.sparse_checkout(
+                    "set", "--no-cone", *sparse_patterns, *self.files
+                )
+            except GitCommandError:
+                # Fall back to a full checkout
+                pass
         repo.git.checkout(self.commit)
 
+        if reference is not None:
+            # Keep the clone usable once its reference is removed, as git
+            # clone --dissociate does, without repacking all of its objects
+            alternates.unlink()
+            copy_borrowed_objects(repo, reference / ".git" / "objects")
+
 
 class GitRepoDataset(Dataset):
     """Abstract base class for datasets composed of Git repositories.
@@ -550,9 +683,14 @@ class GitRepoDataset(Dataset):
         full_name (str): The full name of the dataset, including the language.
         repos (list[GitRepo]): A list of `GitRepo` objects loaded from the dataset.
         max_repo_size (int): The maximum repository size to consider for analysis.
+        sparse_patterns (dict[str, list[str]]): Patterns of the files to check
+            out for each language, for the SAST tools with a sparse checkout.
+            All files are checked out if not set.
 
     """
 
+    sparse_patterns: dict[str, list[str]] = {}
+
     def __init__(self, lang: str) -> None:
         """Initialize a GitRepoDataset instance.
 
@@ -15,6 +15,7 @@ Attributes:
 """
 
 import importlib
+import os
 
 from codesectools.sasts.core.cli import CLIFactory
 from codesectools.sasts.core.sast import SAST, AnalysisResult
@@ -26,6 +27,17 @@ from codesectools.utils import SASTS_DIR
 class LazySASTLoader:
     """Lazily load SAST tool components to avoid premature imports."""
 
+    __slots__ = (
+        "name",
+        "loaded",
+        "sast",
+        "sast_instance",
+        "analysis_result",
+        "cli_module",
+        "cli_factory",
+        "_data",
+    )
+
     def __init__(self, name: str) -> None:
         """Initialize the lazy loader.
 
@@ -97,9 +109,10 @@ class LazySASTLoader:
 
 
 SASTS_ALL = {}
-for child in (SASTS_DIR / "tools").iterdir():
-    if child.is_dir():
-        sast_name = child.name
-        SASTS_ALL[sast_name] = LazySASTLoader(sast_name)
+with os.scandir(SASTS_DIR / "tools") as entries:
+    for child in entries:
+        if child.is_dir():
+            sast_name = child.name
+            SASTS_ALL[sast_name] = LazySASTLoader(sast_name)
 
 SASTS_ALL = dict(sorted(SASTS_ALL.items()))
@@ -1,7 +1,8 @@
 """Defines the command-line interface for running all available SAST tools."""
 
-import shutil
+import importlib
 from pathlib import Path
+from typing import Optional
 
 import typer
 from click import Choice
@@ -11,12 +12,16 @@ from typing_extensions import Annotated, Literal
 from codesectools.datasets import DATASETS_ALL
 from codesectools.datasets.core.dataset import FileDataset, GitRepoDataset
 from codesectools.sasts import SASTS_ALL
-from codesectools.sasts.all.report.HTML import HTMLReport
-from codesectools.sasts.all.report.SARIF import SARIFReport
 from codesectools.sasts.all.sast import AllSAST
+from codesectools.sasts.core.cli import LazyChoice
 from codesectools.sasts.core.sast import PrebuiltBuildlessSAST, PrebuiltSAST
+from codesectools.utils import rmtree_in_background
 
-REPORT_FORMATS = {"HTML": HTMLReport, "SARIF": SARIFReport}
+# Report engines are imported on use (the SARIF one loads the whole SARIF schema)
+REPORT_FORMATS = {
+    "HTML": ("codesectools.sasts.all.report.HTML", "HTMLReport"),
+    "SARIF": ("codesectools.sasts.all.report.SARIF", "SARIFReport"),
+}
 
 
 def build_cli() -> typer.Typer:
@@ -108,23 +113,20 @@ def build_cli() -> typer.Typer:
                 continue
 
             output_dir = sast.output_dir / Path.cwd().name
-            if output_dir.is_dir():
-                if overwrite:
-                    shutil.rmtree(output_dir)
-                    sast.run_analysis(lang, Path.cwd(), output_dir, artifacts=artifacts)
-                else:
-                    print(f"Found existing analysis result at {output_dir}")
-                    print("Use --overwrite to overwrite it")
-            else:
-                sast.run_analysis(lang, Path.cwd(), output_dir, artifacts=artifacts)
+            if not overwrite and output_dir.is_dir():
+                print(f"Found existing analysis result at {output_dir}")
+                print("Use --overwrite to overwrite it")
+                continue
+
+            sast.run_analysis(lang, Path.cwd(), output_dir, artifacts=artifacts)
 
     @cli.command(help="Benchmark a dataset using all SAST tools.")
     def benchmark(
         dataset: Annotated[
             str,
             typer.Argument(
-                click_type=Choice(
-                    [
+                click_type=LazyChoice(
+                    lambda: [
                         f"{d.name}_{lang}"
                         for d in all_sast.sasts_by_dataset
                         for lang in d.supported_languages
@@ -147,6 +149,23 @@ def build_cli() -> typer.Typer:
                 help="Run benchmark over a single dataset unit for testing",
             ),
         ] = False,
+        jobs: Annotated[
+            int,
+            typer.Option(
+                "--jobs",
+                "-j",
+                min=1,
+                help="Number of repositories analyzed in parallel (only applicable on CVEfixes)",
+            ),
+        ] = 1,
+        limit: Annotated[
+            Optional[int],
+            typer.Option(
+                "--limit",
+                min=1,
+                help="Only analyze the N smallest repositories (only applicable on CVEfixes)",
+            ),
+        ] = None,
     ) -> None:
         """Run a benchmark on a dataset using all available SAST tools.
 
@@ -154,6 +173,8 @@ def build_cli() -> typer.Typer:
             dataset: The name of the dataset to benchmark.
             overwrite: If True, overwrite existing results.
             testing: If True, run benchmark over a single dataset unit for testing.
+            jobs: The number of repositories analyzed in parallel.
+            limit: If set, only analyze this number of repositories, the smallest first.
 
         """
         dataset_name, lang = dataset.split("_")
@@ -162,7 +183,7 @@ def build_cli() -> typer.Typer:
             if isinstance(dataset, FileDataset):
                 sast.analyze_files(dataset, overwrite, testing)
             elif isinstance(dataset, GitRepoDataset):
-                sast.analyze_repos(dataset, overwrite, testing)
+                sast.analyze_repos(dataset, overwrite, testing, jobs, limit)
 
     @cli.command(name="list", help="List existing analysis results.")
     def list_() -> None:
@@ -204,7 +225,7 @@ def build_cli() -> typer.Typer:
         project: Annotated[
             str,
             typer.Argument(
-                click_type=Choice(all_sast.list_results(project=True)),
+                click_type=LazyChoice(lambda: all_sast.list_results(project=True)),
                 metavar="PROJECT",
             ),
         ],
@@ -238,7 +259,7 @@ def build_cli() -> typer.Typer:
         project: Annotated[
             str,
             typer.Argument(
-                click_type=Choice(all_sast.list_results(project=True)),
+                click_type=LazyChoice(lambda: all_sast.list_results(project=True)),
                 metavar="PROJECT",
             ),
         ],
@@ -275,19 +296,18 @@ def build_cli() -> typer.Typer:
 
         """
         report_dir = all_sast.output_dir / project / "report" / format
-        if report_dir.is_dir():
-            if overwrite:
-                shutil.rmtree(report_dir)
-            else:
-                print(f"Found existing report for {project} at {report_dir}")
-                print("Use --overwrite to overwrite it")
-                raise typer.Exit()
+        if overwrite:
+            rmtree_in_background(report_dir)
+        elif report_dir.is_dir():
+            print(f"Found existing report for {project} at {report_dir}")
+            print("Use --overwrite to overwrite it")
+            raise typer.Exit()
 
         report_dir.mkdir(parents=True)
 
-        report_engine = REPORT_FORMATS[format](
-            project=project, all_sast=all_sast, top=top
-        )
+        module_name, class_name = REPORT_FORMATS[format]
+        report_class = getattr(importlib.import_module(module_name), class_name)
+        report_engine = report_class(project=project, all_sast=all_sast, top=top)
         report_engine.generate()
         print(f"Report generated at {report_dir.resolve()}")
 
@@ -1,7 +1,11 @@
 """Provides classes for generating plots and visualizations from aggregated SAST results."""
 
-import matplotlib.pyplot as plt
+import heapq
+
+import matplotlib
+import numpy as np
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 
 from codesectools.sasts.all.sast import AllSAST
 from codesectools.sasts.core.graphics import Graphics as CoreGraphics
@@ -27,7 +31,7 @@ class Graphics(CoreGraphics):
         self.all_sast = AllSAST()
         self.output_dir = self.all_sast.output_dir / project_name
         self.sast_color = {}
-        cmap = plt.get_cmap("Set2")
+        cmap = matplotlib.colormaps["Set2"]
         self.sast_names = []
         for i, sast in enumerate(self.all_sast.partial_sasts):
             if self.project_name in sast.list_results(project=True):
@@ -50,45 +54,46 @@ class ProjectGraphics(Graphics):
 
     def plot_overview(self) -> Figure:
         """Generate an overview plot with stats by files, SAST tools, and levels."""
-        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax1, ax2, ax3 = fig.subplots(1, 3)
         by_files = self.result.stats_by_files()
         by_sasts = self.result.stats_by_sasts()
         by_levels = self.result.stats_by_levels()
 
         # Plot by files
         X_files, Y_files = [], []
-        sorted_files = sorted(
-            list(by_files.items()), key=lambda e: e[1]["count"], reverse=True
+        top_files = heapq.nlargest(
+            self.limit, by_files.items(), key=lambda e: e[1]["count"]
         )
-        for k, v in sorted_files[: self.limit]:
+        sast_counts = np.zeros((len(top_files), len(self.sast_names)))
+        sast_index = {sast_name: j for j, sast_name in enumerate(self.sast_names)}
+        for i, (k, v) in enumerate(top_files):
             X_files.append(shorten_path(k))
             Y_files.append(v["count"])
 
-            COLORS_COUNT = {v: 0 for k, v in self.sast_color.items()}
-
             for sast_name in v["sasts"]:
-                color = self.sast_color[sast_name]
-                COLORS_COUNT[color] += 1
+                sast_counts[i, sast_index[sast_name]] += 1
 
-            bars = []
-            current_height = 0
-            for color, height in COLORS_COUNT.items():
-                if height > 0:
-                    bars.append((shorten_path(k), current_height + height, color))
-                    current_height += height
-
-            for k_short, height, color in bars[::-1]:
-                ax1.bar(k_short, height, color=color)
+        # One stacked bar series per SAST tool instead of one bar per file and tool
+        bottom = np.zeros(len(X_files))
+        for j, sast_name in enumerate(self.sast_names):
+            ax1.bar(
+                X_files,
+                sast_counts[:, j],
+                bottom=bottom,
+                color=self.sast_color[sast_name],
+            )
+            bottom += sast_counts[:, j]
 
         ax1.set_xticks(X_files, X_files, rotation=45, ha="right")
         ax1.set_title(f"Stats by files (limit to {self.limit})")
 
         # Plot by sasts
         X_sasts, Y_checkers = [], []
-        sorted_checkers = sorted(
-            list(by_sasts.items()), key=lambda e: e[1]["count"], reverse=True
+        top_sasts = heapq.nlargest(
+            self.limit, by_sasts.items(), key=lambda e: e[1]["count"]
         )
-        for k, v in sorted_checkers[: self.limit]:
+        for k, v in top_sasts:
             X_sasts.append(k)
             Y_checkers.append(v["count"])
 
@@ -102,23 +107,24 @@ class ProjectGraphics(Graphics):
 
         # Plot by levels
         X_levels = ["error", "warning", "note", "none"]
-        for level in X_levels:
+        level_counts = np.zeros((len(X_levels), len(self.sast_names)))
+        for i, level in enumerate(X_levels):
             if not by_levels.get(level):
                 continue
 
-            sast_counts = by_levels[level]["sast_counts"]
-
-            bars = []
-            current_height = 0
-            for sast_name, count in sorted(sast_counts.items()):
-                color = self.sast_color[sast_name]
-                height = count
-                if height > 0:
-                    bars.append((level, current_height + height, color))
-                    current_height += height
-
-            for level_name, height, color in bars[::-1]:
-                ax3.bar(level_name, height, color=color)
+            for sast_name, count in by_levels[level]["sast_counts"].items():
+                level_counts[i, sast_index[sast_name]] = count
+
+        bottom = np.zeros(len(X_levels))
+        for sast_name in sorted(self.sast_names):
+            j = sast_index[sast_name]
+            ax3.bar(
+                X_levels,
+                level_counts[:, j],
+                bottom=bottom,
+                color=self.sast_color[sast_name],
+            )
+            bottom += level_counts[:, j]
 
         ax3.set_xticks(X_levels, X_levels, rotation=45, ha="right")
         ax3.set_title("Stats by levels")
@@ -129,24 +135,24 @@ class ProjectGraphics(Graphics):
         )
         labels = list(self.sast_color.keys())
         handles = [
-            plt.Rectangle((0, 0), 1, 1, color=self.sast_color[label])
-            for label in labels
+            Rectangle((0, 0), 1, 1, color=self.sast_color[label]) for label in labels
         ]
-        plt.legend(handles, labels)
+        ax3.legend(handles, labels)
 
         return fig
 
     def plot_top_cwes(self) -> Figure:
         """Generate a stacked bar plot for the top CWEs found."""
-        fig, ax = plt.subplots(1, 1, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
         by_cwes = self.result.stats_by_cwes()
 
-        sorted_cwes = sorted(
-            list(by_cwes.items()), key=lambda item: item[1]["count"], reverse=True
+        top_cwes = heapq.nlargest(
+            self.limit, by_cwes.items(), key=lambda item: item[1]["count"]
         )
 
         X_cwes, cwe_data = [], []
-        for cwe, data in sorted_cwes[: self.limit]:
+        for cwe, data in top_cwes:
             X_cwes.append(f"{cwe.name}")
             cwe_data.append(data)
 
@@ -174,25 +180,24 @@ class ProjectGraphics(Graphics):
 
     def plot_top_scores(self) -> Figure:
         """Generate a stacked bar plot for files with the highest scores."""
-        fig, ax = plt.subplots(1, 1, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
         by_scores = self.result.stats_by_scores()
 
         for file, data in by_scores.items():
             by_scores[file]["total_score"] = sum(data["score"].values())
 
-        sorted_files = sorted(
-            list(by_scores.items()),
-            key=lambda item: item[1]["total_score"],
-            reverse=True,
+        top_files = heapq.nlargest(
+            self.limit, by_scores.items(), key=lambda item: item[1]["total_score"]
         )
 
         X_files, score_data = [], []
-        for file, data in sorted_files[: self.limit]:
+        for file, data in top_files:
             X_files.append(shorten_path(file))
             score_data.append(data["score"])
 
         score_keys = score_data[0].keys()
-        score_colors = plt.get_cmap("Set2", len(score_keys))
+        score_colors = matplotlib.colormaps["Set2"].resampled(len(score_keys))
         bottoms = [0] * len(X_files)
 
         for i, key in enumerate(score_keys):
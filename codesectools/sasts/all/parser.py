@@ -1,9 +1,11 @@
 """Provides classes for parsing and aggregating results from multiple SAST tools."""
 
+from collections import Counter, defaultdict
+from functools import cached_property
 from typing import TYPE_CHECKING, Self
 
 from codesectools.sasts import SASTS_ALL
-from codesectools.sasts.core.parser import AnalysisResult
+from codesectools.sasts.core.parser import AnalysisResult, Defect
 from codesectools.utils import group_successive
 
 if TYPE_CHECKING:
@@ -13,6 +15,8 @@ if TYPE_CHECKING:
 class AllSASTAnalysisResult:
     """Represent the aggregated results from multiple SAST analyses on a single project."""
 
+    level_severity = {"error": 1, "warning": 0.5, "note": 0.25, "none": 0.125}
+
     def __init__(self, name: str, analysis_results: dict[str, AnalysisResult]) -> None:
         """Initialize an AllSASTAnalysisResult instance.
 
@@ -53,103 +57,104 @@ class AllSASTAnalysisResult:
     @classmethod
     def load_from_output_dir(cls, project_name: str) -> Self:
         """Load and parse analysis results from all SAST tools for a given project."""
-        analysis_results = {}
+        from concurrent.futures import ThreadPoolExecutor
+
+        output_dirs = {}
         for sast_name, sast_data in SASTS_ALL.items():
             sast_instance: SAST = sast_data["sast"]()
             output_dir = sast_instance.output_dir / project_name
             if output_dir.is_dir():
-                analysis_results[sast_name] = sast_instance.parser.load_from_output_dir(
-                    output_dir=output_dir
+                output_dirs[sast_name] = (sast_instance.parser, output_dir)
+
+        # Overlap reading the results of each SAST tool
+        with ThreadPoolExecutor(max_workers=max(1, len(output_dirs))) as executor:
+            futures = {
+                sast_name: executor.submit(
+                    parser.load_cached_from_output_dir, output_dir
                 )
+                for sast_name, (parser, output_dir) in output_dirs.items()
+            }
+            analysis_results = {
+                sast_name: future.result() for sast_name, future in futures.items()
+            }
         return cls(name=project_name, analysis_results=analysis_results)
 
+    @cached_property
+    def defects_by_files(self) -> dict[str, list[Defect]]:
+        """Group the defects by file, shared by the scoring and the report data."""
+        defects_by_files = defaultdict(list)
+        for defect in self.defects:
+            defects_by_files[defect.filepath_str].append(defect)
+        return dict(defects_by_files)
+
     def stats_by_files(self) -> dict:
         """Calculate statistics on defects, grouped by file."""
-        stats = {}
+        stats = defaultdict(lambda: {"count": 0, "sasts": []})
         for defect in self.defects:
-            if defect.filepath_str not in stats.keys():
-                stats[defect.filepath_str] = {"count": 1, "sasts": [defect.sast_name]}
-            else:
-                stats[defect.filepath_str]["sasts"].append(defect.sast_name)
-                stats[defect.filepath_str]["count"] += 1
+            file_stats = stats[defect.filepath_str]
+            file_stats["count"] += 1
+            file_stats["sasts"].append(defect.sast_name)
 
-        return stats
+        return dict(stats)
 
     def stats_by_sasts(self) -> dict:
         """Calculate statistics on defects, grouped by SAST tool."""
-        stats = {}
-        for defect in self.defects:
-            if defect.sast_name not in stats.keys():
-                stats[defect.sast_name] = {"count": 1}
-            else:
-                stats[defect.sast_name]["count"] += 1
-
-        return stats
+        counts = Counter(defect.sast_name for defect in self.defects)
+        return {sast_name: {"count": count} for sast_name, count in counts.items()}
 
     def stats_by_levels(self) -> dict:
         """Calculate statistics on defects, grouped by severity level."""
-        stats = {}
+        sast_counts = defaultdict(Counter)
         for defect in self.defects:
-            if defect.level not in stats.keys():
-                stats[defect.level] = {"count": 0, "sast_counts": {}}
+            sast_counts[defect.level][defect.sast_name] += 1
 
-            stats[defect.level]["count"] += 1
-            sast_counts = stats[defect.level]["sast_counts"]
-            sast_counts[defect.sast_name] = sast_counts.get(defect.sast_name, 0) + 1
-        return stats
+        return {
+            level: {"count": counts.total(), "sast_counts": dict(counts)}
+            for level, counts in sast_counts.items()
+        }
 
     def stats_by_cwes(self) -> dict:
         """Calculate statistics on defects, grouped by CWE."""
-        stats = {}
+        files = defaultdict(dict)
+        sast_counts = defaultdict(Counter)
         for defect in self.defects:
             if defect.cwe.id == -1:
                 continue
 
-            if defect.cwe not in stats:
-                stats[defect.cwe] = {
-                    "count": 1,
-                    "files": [defect.filepath_str],
-                    "sast_counts": {defect.sast_name: 1},
-                }
-            else:
-                stats[defect.cwe]["count"] += 1
-                if defect.filepath_str not in stats[defect.cwe]["files"]:
-                    stats[defect.cwe]["files"].append(defect.filepath_str)
-                stats[defect.cwe]["sast_counts"][defect.sast_name] = (
-                    stats[defect.cwe]["sast_counts"].get(defect.sast_name, 0) + 1
-                )
-        return stats
+            # Dict keys deduplicate files and keep their order
+            files[defect.cwe][defect.filepath_str] = None
+            sast_counts[defect.cwe][defect.sast_name] += 1
+
+        return {
+            cwe: {
+                "count": counts.total(),
+                "files": list(files[cwe]),
+                "sast_counts": dict(counts),
+            }
+            for cwe, counts in sast_counts.items()
+        }
 
     def stats_by_scores(self) -> dict:
         """Calculate a risk score for each file based on defect data."""
-        defect_files = {}
-        for defect in self.defects:
-            if defect.filepath_str not in defect_files:
-                defect_files[defect.filepath_str] = []
-            defect_files[defect.filepath_str].append(defect)
-
+        sast_names = set(self.sast_names)
         stats = {}
-        for defect_file, defects in defect_files.items():
+        for defect_file, defects in self.defects_by_files.items():
             defects_cwes = {d.cwe for d in defects if d.cwe.id != -1}
 
             same_cwe = 0
             for cwe in defects_cwes:
                 cwes_sasts = {d.sast_name for d in defects if d.cwe == cwe}
-                if set(self.sast_names) == cwes_sasts:
+                if sast_names == cwes_sasts:
                     same_cwe += 1
                 else:
-                    same_cwe += (len(set(self.sast_names) & cwes_sasts) - 1) / len(
+                    same_cwe += (len(sast_names & cwes_sasts) - 1) / len(
                         self.sast_names
                     )
 
             defects_severity = []
             defect_locations = {}
             for defect in defects:
-                defects_severity.append(
-                    {"error": 1, "warning": 0.5, "note": 0.25, "none": 0.125}[
-                        defect.level
-                    ]
-                )
+                defects_severity.append(self.level_severity[defect.level])
 
                 if defect.lines:
                     for line in defect.lines:
@@ -161,16 +166,13 @@ class AllSASTAnalysisResult:
             same_location_same_cwe = 0
             for _, defects_ in defect_locations.items():
                 same_location_coeff = 0
-                if set(defect.sast_name for defect in defects_) == set(self.sast_names):
+                location_sasts = set(defect.sast_name for defect in defects_)
+                if location_sasts == sast_names:
                     same_location_coeff = 1
                 else:
-                    same_location_coeff = (
-                        len(
-                            set(defect.sast_name for defect in defects_)
-                            & set(self.sast_names)
-                        )
-                        - 1
-                    ) / len(set(self.sast_names))
+                    same_location_coeff = (len(location_sasts & sast_names) - 1) / len(
+                        sast_names
+                    )
                 same_location += same_location_coeff
 
                 defects_by_cwe = {}
@@ -180,20 +182,13 @@ class AllSASTAnalysisResult:
                     defects_by_cwe[defect.cwe].append(defect)
 
                 for _, defects_ in defects_by_cwe.items():
-                    if set(defect.sast_name for defect in defects_) == set(
-                        self.sast_names
-                    ):
+                    cwe_sasts = set(defect.sast_name for defect in defects_)
+                    if cwe_sasts == sast_names:
                         same_location_same_cwe += same_location_coeff * 1
                     else:
                         same_location_same_cwe += (
                             same_location_coeff
-                            * (
-                                len(
-                                    set(defect.sast_name for defect in defects_)
-                                    & set(self.sast_names)
-                                )
-                                - 1
-                            )
+                            * (len(cwe_sasts & sast_names) - 1)
                             / len(self.sast_names)
                         )
 
@@ -220,13 +215,7 @@ class AllSASTAnalysisResult:
         report = {}
         scores = self.stats_by_scores()
 
-        defect_files = {}
-        for defect in self.defects:
-            if defect.filepath_str not in defect_files:
-                defect_files[defect.filepath_str] = []
-            defect_files[defect.filepath_str].append(defect)
-
-        for defect_file, defects in defect_files.items():
+        for defect_file, defects in self.defects_by_files.items():
             locations = []
             for defect in defects:
                 for group in group_successive(defect.lines):
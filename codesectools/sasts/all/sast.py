@@ -1,5 +1,6 @@
 """Defines the logic for orchestrating multiple SAST tools together."""
 
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from codesectools.sasts import SASTS_ALL
@@ -34,7 +35,6 @@ class AllSAST:
                 self.any_sasts.append(sast_data["sast"]())
 
         self.sasts_by_lang = {}
-        self.sasts_by_dataset = {}
 
         for sast in self.full_sasts:
             for lang in sast.supported_languages + sast.extra_languages:
@@ -43,11 +43,17 @@ class AllSAST:
                 else:
                     self.sasts_by_lang[lang] = [sast]
 
+    @cached_property
+    def sasts_by_dataset(self) -> dict:
+        """Group the fully available SAST tools by supported dataset, on first use."""
+        sasts_by_dataset = {}
+        for sast in self.full_sasts:
             for dataset in sast.supported_datasets:
-                if self.sasts_by_dataset.get(dataset):
-                    self.sasts_by_dataset[dataset].append(sast)
+                if sasts_by_dataset.get(dataset):
+                    sasts_by_dataset[dataset].append(sast)
                 else:
-                    self.sasts_by_dataset[dataset] = [sast]
+                    sasts_by_dataset[dataset] = [sast]
+        return sasts_by_dataset
 
     def list_results(
         self, project: bool = False, dataset: bool = False, limit: int | None = None
@@ -5,7 +5,7 @@ standardized `typer` CLI commands (analyze, benchmark, list, plot) for any
 SAST integration.
 """
 
-import shutil
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from typing import Optional, Self
 
@@ -19,11 +19,39 @@ from codesectools.datasets.core.dataset import FileDataset, GitRepoDataset
 from codesectools.sasts.core.sast import SAST, PrebuiltBuildlessSAST, PrebuiltSAST
 
 
+class LazyChoice(Choice):
+    """A `click.Choice` whose choices are computed on use.
+
+    Choices depending on the file system (e.g. existing results) are not
+    computed when the CLI is built, but each time the parameter is parsed
+    or completed: the CLI is built once and may parse many command lines.
+    """
+
+    def __init__(
+        self, get_choices: Callable[[], Iterable[str]], case_sensitive: bool = True
+    ) -> None:
+        """Initialize a LazyChoice instance.
+
+        Args:
+            get_choices: A function returning the available choices.
+            case_sensitive: If False, the choices are matched case-insensitively.
+
+        """
+        self.get_choices = get_choices
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self) -> Sequence[str]:
+        """Compute the available choices."""
+        return tuple(self.get_choices())
+
+
 class CLIFactory:
     """Provide a factory to generate a standard set of CLI commands for a SAST tool.
 
     Attributes:
-        cli (typer.Typer): The `typer` application to which commands will be added.
+        cli (typer.Typer | None): The `typer` application to which commands will be added,
+            built on the first call to `build_cli`.
         sast (SAST): The SAST tool instance for which the CLI is being built.
         help_messages (dict): A dictionary of help messages for the standard commands.
 
@@ -47,14 +75,18 @@ class CLIFactory:
             "plot": """Generate plot for results visualization.""",
         }
         self.help_messages.update(custom_messages)
-        self.build_cli()
+        self.cli = None
 
     def build_cli(self) -> typer.Typer:
-        """Build and return the Typer CLI application for the SAST tool."""
-        self.cli = typer.Typer(
-            name=self.sast.name.lower(), no_args_is_help=True, add_help_option=False
-        )
-        self._add_minimal()
+        """Build and return the Typer CLI application for the SAST tool.
+
+        The application is built on the first call and reused afterwards.
+        """
+        if self.cli is None:
+            self.cli = typer.Typer(
+                name=self.sast.name.lower(), no_args_is_help=True, add_help_option=False
+            )
+            self._add_minimal()
         return self.cli
 
     def _add_minimal(self: Self) -> None:
@@ -193,19 +225,12 @@ class CLIFactory:
                 print("[i]Use the flag --artifacts to provide the artifacts")
 
             output_dir = self.sast.output_dir / Path.cwd().name
-            if output_dir.is_dir():
-                if overwrite:
-                    shutil.rmtree(output_dir)
-                    self.sast.run_analysis(
-                        lang, Path.cwd(), output_dir, artifacts=artifacts
-                    )
-                else:
-                    print(f"Found existing analysis result at {output_dir}")
-                    print("Use --overwrite to overwrite it")
-            else:
-                self.sast.run_analysis(
-                    lang, Path.cwd(), output_dir, artifacts=artifacts
-                )
+            if not overwrite and output_dir.is_dir():
+                print(f"Found existing analysis result at {output_dir}")
+                print("Use --overwrite to overwrite it")
+                return
+
+            self.sast.run_analysis(lang, Path.cwd(), output_dir, artifacts=artifacts)
 
     def add_benchmark(self, help: str = "") -> None:
         """Add the 'benchmark' command to the CLI.
@@ -222,7 +247,9 @@ class CLIFactory:
             dataset: Annotated[
                 str,
                 typer.Argument(
-                    click_type=Choice(self.sast.supported_dataset_full_names),
+                    click_type=LazyChoice(
+                        lambda: self.sast.supported_dataset_full_names
+                    ),
                     metavar="DATASET",
                 ),
             ],
@@ -240,6 +267,23 @@ class CLIFactory:
                     help="Run benchmark over a single dataset unit for testing",
                 ),
             ] = False,
+            jobs: Annotated[
+                int,
+                typer.Option(
+                    "--jobs",
+                    "-j",
+                    min=1,
+                    help="Number of repositories analyzed in parallel (only applicable on CVEfixes)",
+                ),
+            ] = 1,
+            limit: Annotated[
+                Optional[int],
+                typer.Option(
+                    "--limit",
+                    min=1,
+                    help="Only analyze the N smallest repositories (only applicable on CVEfixes)",
+                ),
+            ] = None,
         ) -> None:
             """Run a SAST benchmark against a selected dataset.
 
@@ -248,6 +292,8 @@ class CLIFactory:
                     (e.g., "BenchmarkJava_java").
                 overwrite: If True, overwrite existing benchmark results.
                 testing: If True, run benchmark over a single dataset unit for testing.
+                jobs: The number of repositories analyzed in parallel.
+                limit: If set, only analyze this number of repositories, the smallest first.
 
             """
             dataset_name, lang = dataset.split("_")
@@ -255,7 +301,7 @@ class CLIFactory:
             if isinstance(dataset, FileDataset):
                 self.sast.analyze_files(dataset, overwrite, testing)
             elif isinstance(dataset, GitRepoDataset):
-                self.sast.analyze_repos(dataset, overwrite, testing)
+                self.sast.analyze_repos(dataset, overwrite, testing, jobs, limit)
 
     ## Parser
     def add_list(self, help: str = "") -> None:
@@ -305,8 +351,8 @@ class CLIFactory:
             result: Annotated[
                 str,
                 typer.Argument(
-                    click_type=Choice(
-                        self.sast.list_results(project=True, dataset=True)
+                    click_type=LazyChoice(
+                        lambda: self.sast.list_results(project=True, dataset=True)
                     ),
                     metavar="RESULT",
                 ),
@@ -5,18 +5,25 @@ visual representations of SAST analysis data, such as defect distributions and
 benchmark performance.
 """
 
+import heapq
+import os
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import typer
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 from rich import print
 
 from codesectools.datasets.core.dataset import FileDataset, GitRepoDataset
 from codesectools.sasts.core.sast import SAST
-from codesectools.shared.cwe import CWE
 from codesectools.utils import shorten_path
 
+if TYPE_CHECKING:
+    from codesectools.shared.cwe import CWE
+
 
 class Graphics:
     """Base class for generating plots and visualizations from SAST results.
@@ -76,11 +83,9 @@ class Graphics:
                     print(f"Figure {fig_name} not saved")
                     continue
 
-            fig.savefig(figure_path, bbox_inches="tight")
+            fig.savefig(figure_path)
             print(f"Figure {fig_name} saved at {figure_path}")
 
-            plt.close(fig)
-
 
 ## Single project
 class ProjectGraphics(Graphics):
@@ -100,7 +105,7 @@ class ProjectGraphics(Graphics):
 
         """
         super().__init__(sast=sast, project_name=project_name)
-        self.result = sast.parser.load_from_output_dir(self.output_dir)
+        self.result = sast.parser.load_cached_from_output_dir(self.output_dir)
         self.plot_functions.extend([self.plot_overview])
 
     def checker_to_level(self, checker: str) -> str:
@@ -124,46 +129,47 @@ class ProjectGraphics(Graphics):
         """
         project_name = self.result.name
 
-        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax1, ax2, ax3 = fig.subplots(1, 3)
         by_files = self.result.stats_by_files()
         by_checkers = self.result.stats_by_checkers()
         by_levels = self.result.stats_by_levels()
 
         # Plot by files
         X_files, Y_files = [], []
-        sorted_files = sorted(
-            list(by_files.items()), key=lambda e: e[1]["count"], reverse=True
+        top_files = heapq.nlargest(
+            self.limit, by_files.items(), key=lambda e: e[1]["count"]
         )
-        for k, v in sorted_files[: self.limit]:
+        levels = list(self.level_color_map)
+        level_index = {level: j for j, level in enumerate(levels)}
+        level_counts = np.zeros((len(top_files), len(levels)))
+        for i, (k, v) in enumerate(top_files):
             X_files.append(shorten_path(k))
             Y_files.append(v["count"])
 
-            COLORS_COUNT = {v: 0 for k, v in self.level_color_map.items()}
-
             for checker in v["checkers"]:
-                level = self.checker_to_level(checker)
-                color = self.level_color_map[level]
-                COLORS_COUNT[color] += 1
-
-            bars = []
-            current_height = 0
-            for color, height in COLORS_COUNT.items():
-                if height > 0:
-                    bars.append((shorten_path(k), current_height + height, color))
-                    current_height += height
-
-            for k_short, height, color in bars[::-1]:
-                ax1.bar(k_short, height, color=color)
+                level_counts[i, level_index[self.checker_to_level(checker)]] += 1
+
+        # One stacked bar series per level instead of one bar per file and level
+        bottom = np.zeros(len(X_files))
+        for j, level in enumerate(levels):
+            ax1.bar(
+                X_files,
+                level_counts[:, j],
+                bottom=bottom,
+                color=self.level_color_map[level],
+            )
+            bottom += level_counts[:, j]
 
         ax1.set_xticks(X_files, X_files, rotation=45, ha="right")
         ax1.set_title(f"Stats by files (limit to {self.limit})")
 
         # Plot by checkers
         X_checkers, Y_checkers = [], []
-        sorted_checkers = sorted(
-            list(by_checkers.items()), key=lambda e: e[1]["count"], reverse=True
+        top_checkers = heapq.nlargest(
+            self.limit, by_checkers.items(), key=lambda e: e[1]["count"]
         )
-        for k, v in sorted_checkers[: self.limit]:
+        for k, v in top_checkers:
             X_checkers.append(k)
             Y_checkers.append(v["count"])
 
@@ -177,10 +183,7 @@ class ProjectGraphics(Graphics):
 
         # Plot by levels
         X_levels, Y_levels = [], []
-        sorted_levels = sorted(
-            list(by_levels.items()),
-            key=lambda e: list(self.level_color_map.keys()).index(e[0]),
-        )
+        sorted_levels = sorted(by_levels.items(), key=lambda e: level_index[e[0]])
         for k, v in sorted_levels[: self.limit]:
             X_levels.append(k)
             Y_levels.append(v["count"])
@@ -199,10 +202,10 @@ class ProjectGraphics(Graphics):
         )
         labels = list(self.level_color_map.keys())
         handles = [
-            plt.Rectangle((0, 0), 1, 1, color=self.level_color_map[label])
+            Rectangle((0, 0), 1, 1, color=self.level_color_map[label])
             for label in labels
         ]
-        plt.legend(handles, labels)
+        ax3.legend(handles, labels)
 
         return fig
 
@@ -238,45 +241,38 @@ class FileDatasetGraphics(ProjectGraphics):
 
         """
         b = self.benchmark_data
-        fig, ax = plt.subplots(1, 1, layout="constrained")
-        cwe_counter: dict[CWE, dict[str, int]] = {}
-
-        def init_cwe_counter(cwe: CWE) -> None:
-            if cwe not in cwe_counter:
-                cwe_counter[cwe] = {"tp": 0, "fp": 0, "fn": 0}
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
+        cwe_counter: dict[CWE, Counter[str]] = defaultdict(Counter)
 
         for cwe in b.tp_cwes:
-            init_cwe_counter(cwe)
             cwe_counter[cwe]["tp"] += 1
 
         for cwe in b.fp_cwes:
-            init_cwe_counter(cwe)
             cwe_counter[cwe]["fp"] += 1
 
         for cwe in b.fn_cwes:
-            init_cwe_counter(cwe)
             cwe_counter[cwe]["fn"] += 1
 
         X, Y1, Y2, Y3 = [], [], [], []
         # Sort by TP, then FN, then FP
-        sorted_cwes = sorted(
-            list(cwe_counter.items()),
+        top_cwes = heapq.nlargest(
+            self.limit,
+            cwe_counter.items(),
             key=lambda i: (
                 i[1]["tp"],
                 i[1]["fn"],
                 i[1]["fp"],
             ),
-            reverse=True,
         )
 
-        for cwe, v in sorted_cwes[: self.limit]:
+        for cwe, v in top_cwes:
             X.append(f"{cwe.name} (ID: {cwe.id})")
             Y1.append(v["tp"])
             Y2.append(v["fp"])
             Y3.append(v["fn"])
 
         ax.set_xticks(range(len(X)), X, rotation=45, ha="right")
-        ax.set_xticklabels(X)
         ax.set_yscale("log")
         width = 0.25
         bars1 = ax.bar(
@@ -303,7 +299,7 @@ class FileDatasetGraphics(ProjectGraphics):
         ax.bar_label(bars1, padding=0)
         ax.bar_label(bars2, padding=0)
         ax.bar_label(bars3, padding=0)
-        plt.legend()
+        ax.legend()
         fig.suptitle("TOP predicted CWEs")
         return fig
 
@@ -328,9 +324,10 @@ class GitRepoDatasetGraphics(Graphics):
         """
         super().__init__(sast=sast, project_name=dataset.full_name)
         self.dataset = dataset
-        analyzed_repo = {repo.name for repo in dataset.repos} & set(
-            dir.name for dir in self.output_dir.iterdir()
-        )
+        with os.scandir(self.output_dir) as entries:
+            analyzed_repo = {repo.name for repo in dataset.repos} & {
+                entry.name for entry in entries if entry.is_dir()
+            }
         repo_paths = [self.output_dir / repo_name for repo_name in analyzed_repo]
         self.results = sast.parser.load_from_output_dirs(repo_paths)
         self.benchmark_data = self.dataset.validate(self.results)
@@ -363,7 +360,8 @@ class GitRepoDatasetGraphics(Graphics):
 
         """
         b = self.benchmark_data
-        fig, ax = plt.subplots(1, 1, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
         set_names = ["tp_defects", "fp_defects"]
         X, Y = ["True Positives", "False Positives"], [0, 0]
         COLORS_COUNT = [
@@ -377,15 +375,17 @@ class GitRepoDatasetGraphics(Graphics):
                     color = self.level_color_map[defect.level]
                     COLORS_COUNT[i][color] += 1
 
-                bars = []
-                current_height = 0
-                for color, height in COLORS_COUNT[i].items():
-                    if height > 0:
-                        bars.append((X[i], current_height + height, color))
-                        current_height += height
+        # Draw the stacked bars once, not again after every repository
+        for i, counts in enumerate(COLORS_COUNT):
+            bars = []
+            current_height = 0
+            for color, height in counts.items():
+                if height > 0:
+                    bars.append((X[i], current_height + height, color))
+                    current_height += height
 
-                for label, height, color in bars[::-1]:
-                    ax.bar(label, height, color=color)
+            for label, height, color in bars[::-1]:
+                ax.bar(label, height, color=color)
 
         for i, counts in enumerate(COLORS_COUNT):
             current_height = 0
@@ -406,10 +406,10 @@ class GitRepoDatasetGraphics(Graphics):
         )
         labels = list(self.level_color_map.keys())
         handles = [
-            plt.Rectangle((0, 0), 1, 1, color=self.level_color_map[label])
+            Rectangle((0, 0), 1, 1, color=self.level_color_map[label])
             for label in labels
         ]
-        plt.legend(handles, labels)
+        ax.legend(handles, labels)
         return fig
 
     def plot_top_cwes(self) -> Figure:
@@ -420,49 +420,42 @@ class GitRepoDatasetGraphics(Graphics):
 
         """
         b = self.benchmark_data
-        fig, ax = plt.subplots(1, 1, layout="constrained")
-        cwe_counter: dict[CWE, dict[str, int]] = {}
-
-        def init_cwe_counter(cwe: CWE) -> None:
-            if cwe not in cwe_counter:
-                cwe_counter[cwe] = {"tp": 0, "fp": 0, "fn": 0}
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
+        cwe_counter: dict[CWE, Counter[str]] = defaultdict(Counter)
 
         for result in b.validated_repos:
             # True Positives
             for cwe in result["tp_cwes"]:
-                init_cwe_counter(cwe)
                 cwe_counter[cwe]["tp"] += 1
 
             # False Positives
             for cwe in result["fp_cwes"]:
-                init_cwe_counter(cwe)
                 cwe_counter[cwe]["fp"] += 1
 
             # False Negatives
             for cwe in result["fn_cwes"]:
-                init_cwe_counter(cwe)
                 cwe_counter[cwe]["fn"] += 1
 
         X, Y1, Y2, Y3 = [], [], [], []
         # Sort by TP, then FN, then FP
-        sorted_cwes = sorted(
-            list(cwe_counter.items()),
+        top_cwes = heapq.nlargest(
+            self.limit,
+            cwe_counter.items(),
             key=lambda i: (
                 i[1]["tp"],
                 i[1]["fn"],
                 i[1]["fp"],
             ),
-            reverse=True,
         )
 
-        for cwe, v in sorted_cwes[: self.limit]:
+        for cwe, v in top_cwes:
             X.append(f"{cwe.name} (ID: {cwe.id})")
             Y1.append(v["tp"])
             Y2.append(v["fp"])
             Y3.append(v["fn"])
 
         ax.set_xticks(range(len(X)), X, rotation=45, ha="right")
-        ax.set_xticklabels(X)
         ax.set_yscale("log")
         width = 0.25
         bars1 = ax.bar(
@@ -489,7 +482,7 @@ class GitRepoDatasetGraphics(Graphics):
         ax.bar_label(bars1, padding=0)
         ax.bar_label(bars2, padding=0)
         ax.bar_label(bars3, padding=0)
-        plt.legend()
+        ax.legend()
         fig.suptitle(f"TOP predicted CWEs on {self.dataset.name}")
         return fig
 
@@ -501,7 +494,8 @@ class GitRepoDatasetGraphics(Graphics):
 
         """
         b = self.benchmark_data
-        fig, ax = plt.subplots(1, 1, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
         set_names = ["tp_defects", "fp_defects"]
         X, Y = [], []
         for result in b.validated_repos:
@@ -537,7 +531,8 @@ class GitRepoDatasetGraphics(Graphics):
 
         """
         b = self.benchmark_data
-        fig, ax = plt.subplots(1, 1, layout="constrained")
+        fig = Figure(layout="constrained")
+        ax = fig.subplots(1, 1)
         X, Y = [], []
 
         for result in b.validated_repos:
@@ -6,12 +6,133 @@ the overall analysis process. Each SAST integration must implement a concrete
 subclass of `AnalysisResult` to parse its specific output format.
 """
 
+import os
+import sys
+import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Literal, Self
 from urllib.parse import unquote
 
-from codesectools.shared.cwe import CWE
+from codesectools.shared.cwe import CWE, CWEs
+from codesectools.utils import CPU_COUNT, DEBUG
+
+
+@cache
+def get_package_version() -> str:
+    """Get the installed version of the package, used to invalidate caches."""
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("codesectools")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def get_stamp(path: Path) -> tuple[int, int, int] | None:
+    """Get a stamp of a file or directory, which changes when it is replaced.
+
+    Args:
+        path: The path to the file or directory.
+
+    Returns:
+        The inode, size and modification time of the path, or None if it does
+        not exist.
+
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+@lru_cache(maxsize=4096)
+def decode_filepath(filepath: str) -> tuple[Path, str]:
+    """URL decode the file path of a defect and resolve it.
+
+    Defects are often reported many times on the same files, each path is
+    decoded and resolved once.
+
+    Args:
+        filepath: The file path reported by the SAST tool.
+
+    Returns:
+        A tuple with the decoded path and its resolved string representation.
+
+    """
+    path = Path(unquote(filepath))
+    return path, str(path.resolve())
+
+
+def resolve_filepath(filepath: str) -> tuple[Path, str]:
+    """URL decode the file path of a defect, resolve it and check that it exists.
+
+    Args:
+        filepath: The file path reported by the SAST tool.
+
+    Returns:
+        A tuple with the decoded path and its resolved string representation.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+
+    """
+    path, resolved_path = decode_filepath(filepath)
+    # Not memoized, the file may have been removed since
+    if not path.is_file():
+        raise FileNotFoundError(path.resolve())
+    return path, resolved_path
+
+
+def read_pickled_result(cache_file: Path) -> "AnalysisResult | None":
+    """Read an analysis result from its pickle cache.
+
+    A cached result is only used if the source files of its defects still exist.
+
+    Args:
+        cache_file: The pickle cache file of the result.
+
+    Returns:
+        The cached analysis result, or None if there is no usable cache.
+
+    """
+    import pickle
+
+    try:
+        with cache_file.open("rb") as f:
+            analysis_result = pickle.load(f)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.PickleError):
+        return None
+
+    # Parsing fails on missing sources, do not hide them
+    filepaths = {defect.filepath_str for defect in analysis_result.defects}
+    if all(os.path.isfile(filepath) for filepath in filepaths):
+        return analysis_result
+    return None
+
+
+def write_pickled_result(analysis_result: "AnalysisResult", cache_file: Path) -> None:
+    """Write an analysis result to its pickle cache, replacing stale caches.
+
+    Args:
+        analysis_result: The parsed analysis result.
+        cache_file: The pickle cache file of the result.
+
+    """
+    import pickle
+
+    for stale_cache_file in cache_file.parent.glob(".cache_*.pkl"):
+        stale_cache_file.unlink(missing_ok=True)
+    temp_file = cache_file.with_name(f"{cache_file.stem}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temp_file.open("wb") as f:
+            pickle.dump(analysis_result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except (OSError, pickle.PickleError):
+        temp_file.unlink(missing_ok=True)
 
 
 class Defect:
@@ -31,6 +152,19 @@ class Defect:
 
     """
 
+    # Results can hold many defects, avoid a __dict__ per instance
+    __slots__ = (
+        "filepath",
+        "filepath_str",
+        "filename",
+        "sast_name",
+        "checker",
+        "level",
+        "cwe",
+        "message",
+        "lines",
+    )
+
     def __init__(
         self,
         sast_name: str,
@@ -53,16 +187,12 @@ class Defect:
             lines: A list of line numbers where the defect is located.
 
         """
-        # URL decode
-        filepath = Path(unquote(str(filepath)))
-        if not filepath.is_file():
-            raise FileNotFoundError(filepath.resolve())
-        self.filepath = filepath
-        self.filepath_str = str(filepath.resolve())
-        self.filename = filepath.name
+        self.filepath, self.filepath_str = resolve_filepath(str(filepath))
+        self.filename = self.filepath.name
         self.sast_name = sast_name
-        self.checker = checker
-        self.level = level
+        # Checkers and levels repeat across defects, share a single string
+        self.checker = sys.intern(checker)
+        self.level = sys.intern(level)
         self.cwe = cwe
         self.message = message
         self.lines = lines
@@ -99,16 +229,22 @@ class AnalysisResult(ABC):
         defects (list[Defect]): A list of `Defect` objects found during analysis.
         time (float): The total time taken for the analysis in seconds.
         lines_of_codes (int): The number of lines of code analyzed.
+        cache_dependencies (tuple[Path, ...]): Files outside of the output
+            directory the parsing depends on (e.g. the `.complete` marker of
+            downloaded rules), the cached result is invalidated when they change.
 
     """
 
     sast_name: str
+    cache_dependencies: tuple[Path, ...] = ()
     level_color_map = {
         "error": "red",
         "warning": "orange",
         "note": "yellow",
         "none": "gray",
     }
+    _stats: dict[str, dict] | None = None
+    _stats_size = 0
 
     def __init__(
         self,
@@ -137,10 +273,22 @@ class AnalysisResult(ABC):
         self.time = time
         self.lines_of_codes = lines_of_codes
 
+    @property
+    def defects(self) -> list[Defect]:
+        """Get the list of defects found during the analysis."""
+        return self._defects
+
+    @defects.setter
+    def defects(self, defects: list[Defect]) -> None:
+        """Replace the defects, discarding the statistics of the previous ones."""
+        self._defects = defects
+        self._stats = None
+
     @property
     def files(self) -> list[str]:
         """Get the list of unique file paths containing defects."""
-        return list(set(d.filepath_str for d in self.defects))
+        # Files are already grouped by the cached statistics
+        return list(self.compute_stats()["files"])
 
     def __repr__(self) -> str:
         """Return a developer-friendly string representation of the AnalysisResult.
@@ -175,21 +323,191 @@ class AnalysisResult(ABC):
         """
         pass
 
+    @classmethod
+    def get_cache_file(cls, output_dir: Path) -> Path | None:
+        """Get the pickle cache file of the results of an output directory.
+
+        The cache is keyed by the name, inode, size and modification time of the
+        output files, so it is invalidated when the results are overwritten. The
+        key also covers the other inputs of the parsing: the analyzed project
+        directory, the CWE data and the `cache_dependencies` of the class.
+
+        Args:
+            output_dir: The directory containing the raw analysis output files.
+
+        Returns:
+            The path to the cache file, or None if the cache is disabled (in
+            debug mode) or the directory does not exist.
+
+        """
+        import hashlib
+        import json
+
+        if DEBUG() or not output_dir.is_dir():
+            return None
+
+        with os.scandir(output_dir) as entries:
+            output_files = sorted(
+                (entry.name, get_stamp(entry.path))
+                for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")
+            )
+
+        dependencies = [
+            CWEs.directory / filename for filename in CWEs.cwes_data.values()
+        ]
+        dependencies.extend(cls.cache_dependencies)
+        try:
+            analysis_info = json.loads((output_dir / "codesectools.json").read_bytes())
+            dependencies.append(Path(analysis_info["project_dir"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        dependency_stamps = [(str(path), get_stamp(path)) for path in dependencies]
+
+        key = hashlib.blake2b(
+            repr(
+                (
+                    cls.__module__,
+                    cls.__qualname__,
+                    get_package_version(),
+                    output_files,
+                    dependency_stamps,
+                )
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        return output_dir / f".cache_{key}.pkl"
+
+    @classmethod
+    def load_cached_from_output_dir(cls, output_dir: Path) -> Self:
+        """Load analysis results from a directory, reusing a previous parsing if any.
+
+        The parsed result is pickled in the output directory, see
+        `get_cache_file`.
+
+        Args:
+            output_dir: The directory containing the raw analysis output files.
+
+        Returns:
+            An instance of the `AnalysisResult` subclass.
+
+        """
+        cache_file = cls.get_cache_file(output_dir)
+        if cache_file is None:
+            return cls.load_from_output_dir(output_dir)
+
+        analysis_result = read_pickled_result(cache_file)
+        if analysis_result is None:
+            analysis_result = cls.load_from_output_dir(output_dir)
+            write_pickled_result(analysis_result, cache_file)
+        return analysis_result
+
     @classmethod
     def load_from_output_dirs(cls, output_dirs: list[Path]) -> list[Self]:
         """Load and parse analysis results from multiple directories.
 
+        Cached results are read in the current process, the other directories
+        are parsed in a pool of processes.
+
         Args:
-            output_dirs: An iterable of directory paths containing results.
+            output_dirs: A list of directory paths containing results.
 
         Returns:
             A list of `AnalysisResult` subclass instances.
 
         """
-        analysis_results = []
-        for output_dir in output_dirs:
-            analysis_results.append(cls.load_from_output_dir(output_dir))
-        return analysis_results
+        analysis_results: dict[int, Self] = {}
+        missed_indexes = []
+        for index, output_dir in enumerate(output_dirs):
+            analysis_result = None
+            if cache_file := cls.get_cache_file(output_dir):
+                analysis_result = read_pickled_result(cache_file)
+            if analysis_result is None:
+                missed_indexes.append(index)
+            else:
+                analysis_results[index] = analysis_result
+
+        missed_dirs = [output_dirs[index] for index in missed_indexes]
+        if CPU_COUNT < 2 or len(missed_dirs) < 2:
+            loaded_results = map(cls.load_cached_from_output_dir, missed_dirs)
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Parsing is CPU-bound and each directory is independent. Workers
+            # are not forked, this process may already be running threads
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(CPU_COUNT, len(missed_dirs)),
+                mp_context=multiprocessing.get_context(start_method),
+            ) as executor:
+                loaded_results = list(
+                    executor.map(
+                        cls.load_cached_from_output_dir,
+                        missed_dirs,
+                        chunksize=max(1, len(missed_dirs) // (CPU_COUNT * 4)),
+                    )
+                )
+
+        analysis_results.update(zip(missed_indexes, loaded_results, strict=True))
+        return [analysis_results[index] for index in range(len(output_dirs))]
+
+    def compute_stats(self) -> dict[str, dict]:
+        """Calculate all statistics on defects in a single pass.
+
+        The statistics are computed once and recomputed only if the defects were
+        replaced or added since. The returned statistics are shared, the
+        `stats_by_*` methods return copies that callers may modify.
+
+        Returns:
+            A dictionary with the checker to level mapping under "levels_by_checkers",
+            and the statistics grouped by "checkers", "levels", "files" and "cwes".
+
+        """
+        if self._stats is not None and self._stats_size == len(self.defects):
+            return self._stats
+
+        levels_by_checkers = {}
+        by_checkers = defaultdict(lambda: {"count": 0, "files": []})
+        by_levels = defaultdict(lambda: {"count": 0, "checkers": [], "unique": 0})
+        by_files = defaultdict(lambda: {"count": 0, "checkers": []})
+        by_cwes = defaultdict(lambda: {"count": 0, "files": []})
+        for defect in self.defects:
+            levels_by_checkers.setdefault(defect.checker, defect.level)
+
+            checker_stats = by_checkers[defect.checker]
+            checker_stats["count"] += 1
+            checker_stats["files"].append(defect.filepath_str)
+
+            level_stats = by_levels[defect.level]
+            level_stats["count"] += 1
+            level_stats["checkers"].append(defect.checker)
+
+            file_stats = by_files[defect.filepath_str]
+            file_stats["count"] += 1
+            file_stats["checkers"].append(defect.checker)
+
+            cwe_stats = by_cwes[defect.cwe]
+            cwe_stats["count"] += 1
+            cwe_stats["files"].append(defect.filepath_str)
+
+        # Count unique checkers once per level rather than once per defect
+        for level_stats in by_levels.values():
+            level_stats["unique"] = len(set(level_stats["checkers"]))
+
+        self._stats = {
+            "levels_by_checkers": levels_by_checkers,
+            "checkers": dict(by_checkers),
+            "levels": dict(by_levels),
+            "files": dict(by_files),
+            "cwes": dict(by_cwes),
+        }
+        self._stats_size = len(self.defects)
+        return self._stats
 
     def checker_to_level(self, checker: str) -> str:
         """Map a checker name to its severity level.
@@ -201,10 +519,7 @@ class AnalysisResult(ABC):
             The level string for the checker, or "none" if not found.
 
         """
-        for defect in self.defects:
-            if checker == defect.checker:
-                return defect.level
-        return "none"
+        return self.compute_stats()["levels_by_checkers"].get(checker, "none")
 
     def stats_by_checkers(self) -> dict:
         """Calculate statistics on defects, grouped by checker.
@@ -214,15 +529,7 @@ class AnalysisResult(ABC):
             containing defect counts and affected files.
 
         """
-        stats = {}
-        for defect in self.defects:
-            if defect.checker not in stats.keys():
-                stats[defect.checker] = {"count": 1, "files": [defect.filepath_str]}
-            else:
-                stats[defect.checker]["files"].append(defect.filepath_str)
-                stats[defect.checker]["count"] += 1
-
-        return stats
+        return dict(self.compute_stats()["checkers"])
 
     def stats_by_levels(self) -> dict:
         """Calculate statistics on defects, grouped by level.
@@ -232,22 +539,7 @@ class AnalysisResult(ABC):
             containing counts and checker lists.
 
         """
-        stats = {}
-        for defect in self.defects:
-            if defect.level not in stats.keys():
-                stats[defect.level] = {
-                    "count": 1,
-                    "checkers": [defect.checker],
-                    "unique": 1,
-                }
-            else:
-                stats[defect.level]["checkers"].append(defect.checker)
-                stats[defect.level]["count"] = len(stats[defect.level]["checkers"])
-                stats[defect.level]["unique"] = len(
-                    set(stats[defect.level]["checkers"])
-                )
-
-        return stats
+        return dict(self.compute_stats()["levels"])
 
     def stats_by_files(self) -> dict:
         """Calculate statistics on defects, grouped by file.
@@ -257,15 +549,7 @@ class AnalysisResult(ABC):
             containing defect counts and the checkers that fired.
 
         """
-        stats = {}
-        for defect in self.defects:
-            if defect.filepath_str not in stats.keys():
-                stats[defect.filepath_str] = {"count": 1, "checkers": [defect.checker]}
-            else:
-                stats[defect.filepath_str]["checkers"].append(defect.checker)
-                stats[defect.filepath_str]["count"] += 1
-
-        return stats
+        return dict(self.compute_stats()["files"])
 
     def stats_by_cwes(self) -> dict:
         """Calculate statistics on defects, grouped by CWE ID.
@@ -275,12 +559,4 @@ class AnalysisResult(ABC):
             containing defect counts and affected files.
 
         """
-        stats = {}
-        for defect in self.defects:
-            if defect.cwe not in stats.keys():
-                stats[defect.cwe] = {"count": 1, "files": [defect.filepath_str]}
-            else:
-                stats[defect.cwe]["files"].append(defect.filepath_str)
-                stats[defect.cwe]["count"] += 1
-
-        return stats
+        return dict(self.compute_stats()["cwes"])
@@ -1,22 +1,30 @@
 """Provide a base parser for SAST tools that output in SARIF format."""
 
+from __future__ import annotations
+
 import json
+import re
 from abc import abstractmethod
 from pathlib import Path
-from typing import Self
+from typing import TYPE_CHECKING, Self
+
+from pydantic_core import from_json
 
 from codesectools.sasts.core.parser import AnalysisResult, Defect
-from codesectools.sasts.core.parser.format.SARIF import (
-    PropertyBag,
-    ReportingDescriptor,
-    Result,
-)
-from codesectools.sasts.core.parser.format.SARIF import (
-    StaticAnalysisResultsFormatSarifVersion210JsonSchema as SARIF,
-)
 from codesectools.sasts.core.sast import AnalysisInfo
-from codesectools.shared.cwe import CWE
-from codesectools.utils import MissingFile
+from codesectools.shared.cwe import CWE, CWEs
+from codesectools.utils import DEBUG, MissingFile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from codesectools.sasts.core.parser.format.SARIF import (
+        PropertyBag,
+        ReportingDescriptor,
+        Result,
+    )
+
+CWE_TAG_PATTERN = re.compile(r"cwe-(\d+)")
 
 
 class SARIFAnalysisResult(AnalysisResult):
@@ -29,7 +37,7 @@ class SARIFAnalysisResult(AnalysisResult):
 
         Args:
             output_dir: The directory containing the analysis output.
-            sarif_dict: The raw SARIF data as a dictionary.
+            sarif_dict: The raw SARIF data as a dictionary, patched in place.
             analysis_info: Metadata about the analysis run.
 
         """
@@ -43,15 +51,19 @@ class SARIFAnalysisResult(AnalysisResult):
         )
 
         self.output_dir = output_dir
-        self.sarif_dict = self.patch_dict(sarif_dict.copy())
 
-        self.sarif = SARIF.model_validate(self.sarif_dict)
-        self.run = self.sarif.runs[0]
+        # The SARIF data model is slow to import, only load it when parsing a report
+        from codesectools.sasts.core.parser.format.SARIF import (
+            StaticAnalysisResultsFormatSarifVersion210JsonSchema as SARIF,
+        )
+
+        # The raw report is not kept, only its first run is used
+        sarif = SARIF.model_validate(self.patch_dict(sarif_dict))
+        self.run = sarif.runs[0]
         self.rules = self.get_rules()
         self.raw_rules = self.get_raw_rules()
-        self.results = self.run.results or []
 
-        for result in self.results:
+        for result in self.run.results or []:
             filepath, lines = self.get_location(result)
 
             if not filepath:
@@ -85,16 +97,36 @@ class SARIFAnalysisResult(AnalysisResult):
                 )
             )
 
+        # Only needed to build the defects, the run holds the whole report
+        del self.run
+
+    def __getstate__(self) -> dict:
+        """Get the state to pickle, without the SARIF data only needed to build defects."""
+        state = self.__dict__.copy()
+        for name in ("rules", "raw_rules"):
+            state.pop(name, None)
+        return state
+
+    @classmethod
+    def patch_report(cls, sarif_report: bytes) -> bytes:
+        """Patch the raw SARIF report before it is decoded.
+
+        Textual fixes are cheaper on the raw report than on the decoded dictionary.
+        """
+        return sarif_report
+
     def patch_dict(self, sarif_dict: dict) -> dict:
         """Patch the SARIF dictionary to fix common issues before parsing."""
         return sarif_dict
 
     def save_patched_dict(self, patched_dict: dict) -> None:
-        """Save the patched dictionary to a file for debugging."""
-        json.dump(
-            patched_dict,
-            (self.output_dir / f"{self.sast_name.lower()}_patched.sarif").open("w"),
-        )
+        """Save the patched dictionary to a file for debugging (debug mode only)."""
+        # Serializing the whole report on every load is wasted work otherwise
+        if not DEBUG():
+            return
+        patched_path = self.output_dir / f"{self.sast_name.lower()}_patched.sarif"
+        with patched_path.open("w") as f:
+            json.dump(patched_dict, f)
 
     def get_rules(self) -> dict[str, ReportingDescriptor]:
         """Extract and return all rule descriptors from the SARIF data."""
@@ -137,6 +169,22 @@ class SARIFAnalysisResult(AnalysisResult):
 
         return filepath, lines
 
+    @staticmethod
+    def cwe_from_tags(tags: Iterable[str]) -> CWE:
+        """Get the CWE of the first tag referencing one (e.g. 'external/cwe/cwe-79')."""
+        for tag in tags:
+            tag = tag.lower()
+            _, found, rest = tag.partition("cwe-")
+            if not found:
+                continue
+            # Most tags are "cwe-79", "external/cwe/cwe-79" or "cwe-79: <name>"
+            cwe_id = rest.partition(":")[0]
+            if cwe_id.isdecimal():
+                return CWEs.from_id(int(cwe_id))
+            if m := CWE_TAG_PATTERN.search(tag):
+                return CWEs.from_id(int(m.group(1)))
+        return CWEs.NOCWE
+
     @abstractmethod
     def get_cwe(self, result: Result, rule_id: str) -> CWE:
         """Get the CWE for a given result and rule ID."""
@@ -147,13 +195,14 @@ class SARIFAnalysisResult(AnalysisResult):
         """Load and parse a SARIF report from an output directory."""
         # Analysis Info
         analysis_info = AnalysisInfo.model_validate_json(
-            (output_dir / "codesectools.json").read_text()
+            (output_dir / "codesectools.json").read_bytes()
         )
 
         # Analysis outputs
         sarif_report_path = output_dir / f"{cls.sast_name.lower()}.sarif"
         if sarif_report_path.is_file():
-            sarif_dict = json.load(sarif_report_path.open())
+            # pydantic's JSON parser is faster than json and deduplicates strings
+            sarif_dict = from_json(cls.patch_report(sarif_report_path.read_bytes()))
         else:
             raise MissingFile([str(sarif_report_path)])
 
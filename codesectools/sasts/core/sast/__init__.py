@@ -5,12 +5,18 @@ common interface for running a static analysis tool, saving its results, and
 performing benchmarks against datasets.
 """
 
+import fnmatch
+import heapq
 import os
 import random
 import shutil
 import tempfile
+import threading
 import time
+import uuid
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Literal, Union
 
@@ -21,6 +27,7 @@ from codesectools.datasets import DATASETS_ALL
 from codesectools.datasets.core.dataset import (
     Dataset,
     FileDataset,
+    GitRepo,
     GitRepoDataset,
     PrebuiltFileDataset,
 )
@@ -29,10 +36,13 @@ from codesectools.sasts.core.sast.properties import SASTProperties
 from codesectools.sasts.core.sast.requirements import SASTRequirements
 from codesectools.shared.cloc import Cloc
 from codesectools.utils import (
+    DEBUG,
     USER_OUTPUT_DIR,
     MissingFile,
     NonZeroExit,
+    is_empty_dir,
     render_command,
+    rmtree_in_background,
     run_command,
 )
 
@@ -69,7 +79,8 @@ class SAST(ABC):
         supported_languages (list[str]): A list of supported programming languages.
         extra_languages (list[str]): Languages supported by the tool itself but not codesectools.
         supported_dataset_names (list[str]): Names of compatible datasets.
-        supported_datasets (list[Dataset]): A list of supported dataset classes.
+        supported_datasets (list[Dataset]): A list of supported and downloaded
+            dataset classes.
         properties (SASTProperties): The properties of the SAST tool.
         requirements (SASTRequirements): The requirements for the SAST tool.
         commands (list[list[Union[str, tuple[str]]]]): The list of commands templates to be rendered and executed.
@@ -78,6 +89,8 @@ class SAST(ABC):
         output_files (list[tuple[Path, bool]]): Expected output files and
             whether they are required.
         parser (type[AnalysisResult]): The parser class for the tool's results.
+        sparse_checkout (bool): If True, only the files matching the
+            `sparse_patterns` of a dataset are checked out in its repositories.
         level_color_map (dict): A mapping of result levels to colors for plotting.
         install_help (str | None): An optional string with installation help.
         output_dir (Path): (Instance attribute) The base directory for storing
@@ -93,7 +106,6 @@ class SAST(ABC):
     supported_languages: list[str]
     extra_languages: list[str] = []
     supported_dataset_names: list[str]
-    supported_datasets: list[Dataset]
     properties: SASTProperties
     requirements: SASTRequirements
     commands: list[list[Union[str, tuple[str]]]]
@@ -101,26 +113,39 @@ class SAST(ABC):
     environ: dict[str, str] = {}
     output_files: list[tuple[Path, bool]]
     parser: AnalysisResult
+    sparse_checkout: bool = False
     level_color_map: dict
     install_help: str | None = None
 
     def __init__(self) -> None:
         """Initialize the SAST instance.
 
-        Set up supported datasets, the output directory, and requirement status.
+        Set up the output directory and requirement status.
         """
-        self.supported_datasets = [
-            DATASETS_ALL[d]
-            for d in self.supported_dataset_names
-            if DATASETS_ALL[d].is_cached()
-        ]
         self.output_dir = USER_OUTPUT_DIR / self.name
         self.requirements.name = self.name
         self.status = self.requirements.get_status()
         self.missing = self.requirements.get_missing()
 
+    @property
+    def supported_datasets(self) -> list[Dataset]:
+        """List the supported datasets that are downloaded.
+
+        Computed on each use, datasets can be downloaded in the meantime.
+        """
+        return [
+            DATASETS_ALL[d]
+            for d in self.supported_dataset_names
+            if DATASETS_ALL[d].is_cached()
+        ]
+
     def run_analysis(
-        self, lang: str, project_dir: Path, output_dir: Path, **kwargs: Any
+        self,
+        lang: str,
+        project_dir: Path,
+        output_dir: Path,
+        show_progress: bool = True,
+        **kwargs: Any,
     ) -> None:
         """Run the SAST analysis on a given project directory.
 
@@ -131,6 +156,8 @@ class SAST(ABC):
             lang: The programming language of the project.
             project_dir: The path to the project's source code.
             output_dir: The path to save the analysis results.
+            show_progress: If False, do not display the progress spinner
+                (only one live display can be active at a time).
             **kwargs: Additional tool-specific arguments.
 
         """
@@ -150,33 +177,37 @@ class SAST(ABC):
             else:
                 raise NotImplementedError(k, v)
 
-        # Make temporary directory available to command
-        temp_dir = tempfile.TemporaryDirectory()
-        render_variables["{tempdir}"] = temp_dir.name
-
-        with Progress() as progress:
+        # Make temporary directory available to command, it is removed even
+        # if the analysis fails (but kept in debug mode for inspection)
+        with (
+            tempfile.TemporaryDirectory(
+                prefix="cstools-", delete=not DEBUG()
+            ) as temp_dir,
+            Progress(disable=not show_progress) as progress,
+        ):
+            render_variables["{tempdir}"] = temp_dir
             progress.add_task(
                 f"[b][{self.name}][/b] analyzing: [i]{project_dir.name}[/i]",
                 total=None,
             )
 
-            command_output = ""
+            command_outputs = []
             start = time.time()
             rendered_commands = [
                 render_command(command, render_variables) for command in self.commands
             ]
             for rendered_command in rendered_commands:
                 retcode, out = run_command(rendered_command, project_dir, self.environ)
-                command_output += out
+                command_outputs.append(out)
                 if retcode not in self.valid_codes:
-                    raise NonZeroExit(rendered_command, command_output)
+                    raise NonZeroExit(rendered_command, "".join(command_outputs))
             end = time.time()
 
             lines_of_codes = Cloc(project_dir, lang).get_loc()
 
             analysis_info = AnalysisInfo(
                 command_lines=[" ".join(c) for c in rendered_commands],
-                logs=command_output,
+                logs="".join(command_outputs),
                 lang=lang,
                 duration=end - start,
                 lines_of_codes=lines_of_codes,
@@ -189,43 +220,83 @@ class SAST(ABC):
     ) -> None:
         """Save the results of a SAST analysis.
 
-        Copy the tool's output files and save any extra metadata to the result directory.
+        Move the tool's output files and save any extra metadata to the result
+        directory, replacing previous results if any.
 
         Args:
             project_dir: The directory where the analysis was run.
             output_dir: The directory where results should be saved.
             analysis_info: An `AnalysisInfo` object containing metadata about the analysis.
 
+        Raises:
+            MissingFile: If a required output file is missing, previous results
+                are kept.
+
         """
-        output_dir.mkdir(exist_ok=True, parents=True)
-        (output_dir / "codesectools.json").write_text(
-            analysis_info.model_dump_json(indent=4)
-        )
+        # Results are written to a staging directory which then replaces the
+        # previous results: they are kept if a required output file is missing
+        # or if saving the new results fails
+        output_dir.parent.mkdir(exist_ok=True, parents=True)
+        staging_dir = output_dir.with_name(f".{output_dir.name}.{uuid.uuid4().hex}.new")
+        staging_dir.mkdir()
+        try:
+            (staging_dir / "codesectools.json").write_text(
+                analysis_info.model_dump_json(indent=4)
+            )
 
-        missing_files = []
-        for path_from_root, required in self.output_files:
-            parent_dir = path_from_root.parent
-            filename = path_from_root.name
-            if "*" not in filename:
-                filepath = project_dir / parent_dir / filename
-                if filepath.is_file():
-                    if not filepath == output_dir / filename:
-                        shutil.move(filepath, output_dir / filename)
-                else:
-                    if required:
-                        missing_files.append(filename)
-            else:
-                filepaths = (project_dir / parent_dir).glob(filename)
-                if filepaths:
-                    for filepath in filepaths:
-                        if not filepath == output_dir / filename:
-                            shutil.move(filepath, output_dir / filepath.name)
+            missing_files = []
+            moves = []
+            dir_entries: dict[Path, list[str]] = {}
+            for path_from_root, required in self.output_files:
+                parent_dir = path_from_root.parent
+                filename = path_from_root.name
+                if "*" not in filename:
+                    filepath = project_dir / parent_dir / filename
+                    if filepath.is_file():
+                        moves.append((filepath, staging_dir / filename))
+                    else:
+                        if required:
+                            missing_files.append(filename)
                 else:
-                    if required:
-                        missing_files.append(filename)
-
-        if missing_files:
-            raise MissingFile(missing_files)
+                    # List each directory once, whatever the number of patterns
+                    if parent_dir not in dir_entries:
+                        try:
+                            with os.scandir(project_dir / parent_dir) as entries:
+                                dir_entries[parent_dir] = [
+                                    entry.name for entry in entries if entry.is_file()
+                                ]
+                        except FileNotFoundError:
+                            dir_entries[parent_dir] = []
+
+                    filenames = fnmatch.filter(dir_entries[parent_dir], filename)
+                    if filenames:
+                        for name in filenames:
+                            moves.append(
+                                (project_dir / parent_dir / name, staging_dir / name)
+                            )
+                    else:
+                        if required:
+                            missing_files.append(filename)
+
+            if missing_files:
+                raise MissingFile(missing_files)
+
+            # Moves between file systems are copies, run them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(moves) or 1)) as executor:
+                list(executor.map(lambda move: shutil.move(*move), moves))
+
+            try:
+                # Atomic when there are no previous results (missing or empty)
+                os.replace(staging_dir, output_dir)
+            except OSError:
+                if not output_dir.is_dir():
+                    raise
+                # Otherwise the previous results are moved aside just before
+                rmtree_in_background(output_dir)
+                os.replace(staging_dir, output_dir)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
 
         print(f"Results are saved in {output_dir}")
 
@@ -246,29 +317,38 @@ class SAST(ABC):
         result_path = self.output_dir / dataset.full_name
         result_path.mkdir(exist_ok=True, parents=True)
 
-        if result_path.is_dir():
-            if os.listdir(result_path) and not overwrite:
-                print(
-                    "Results already exist, please use --overwrite to delete old results"
-                )
-                return
+        if not overwrite and not is_empty_dir(result_path):
+            print("Results already exist, please use --overwrite to delete old results")
+            return
 
         self.run_analysis(dataset.lang, dataset.directory, result_path)
 
     def analyze_repos(
-        self, dataset: GitRepoDataset, overwrite: bool = False, testing: bool = False
+        self,
+        dataset: GitRepoDataset,
+        overwrite: bool = False,
+        testing: bool = False,
+        jobs: int = 1,
+        limit: int | None = None,
     ) -> None:
         """Analyze a dataset composed of Git repositories.
 
         Iterate through each repository in the dataset, clone it, check out
         the specified commit, run the analysis, and save the results.
+        Repositories are independent from each other: clones and analyses
+        are pipelined, and up to `jobs` analyses run in parallel.
 
         Args:
             dataset: The `GitRepoDataset` instance to analyze.
             overwrite: If True, re-analyze repositories with existing results.
             testing: If True, run analysis on a sample of two small random repositories for testing purposes.
+            jobs: The number of repositories to analyze in parallel.
+            limit: If set, only analyze this number of repositories, the
+                smallest ones first.
 
         """
+        from git.exc import GitCommandError
+
         result_path = self.output_dir / dataset.full_name
         result_path.mkdir(exist_ok=True, parents=True)
 
@@ -279,23 +359,107 @@ class SAST(ABC):
         else:
             repos = dataset.repos
 
+        if limit is not None:
+            repos = heapq.nsmallest(limit, repos, key=attrgetter("size"))
+
+        pending_repos, skipped_repos = [], []
         for repo in repos:
-            repo_result_path = result_path / repo.name
-            if repo_result_path.is_dir():
-                if list(repo_result_path.iterdir()) and not overwrite:
-                    print(f"Results already exist for {repo.name}, skipping...")
-                    print("Please use --overwrite to analyze again")
-                    continue
+            if not overwrite and not is_empty_dir(result_path / repo.name):
+                skipped_repos.append(repo.name)
+            else:
+                pending_repos.append(repo)
+
+        # Report skipped repositories at once, there can be thousands of them
+        if skipped_repos:
+            names = ", ".join(skipped_repos[:5])
+            if len(skipped_repos) > 5:
+                names += ", ..."
+            print(
+                f"Results already exist for {len(skipped_repos)} repositories ({names}), skipping..."
+            )
+            print("Please use --overwrite to analyze again")
+
+        if not pending_repos:
+            return
 
-            repo_source_path = dataset.directory / repo.name
+        # Clones are network bound while analyses are CPU bound: up to `jobs`
+        # repositories are cloned in advance while `jobs` others are analyzed
+        analysis_slots = threading.BoundedSemaphore(jobs)
+        failed = threading.Event()
+
+        # Many CVEs share the same repository, reuse the objects of the
+        # previous clones instead of downloading them again
+        clones_by_url: dict[str, Path] = {}
+        clones_lock = threading.Lock()
+
+        def clone_and_analyze(repo: GitRepo) -> None:
+            with clones_lock:
+                reference = clones_by_url.get(repo.url)
+            repo_source_path = self.clone_repo(dataset, repo, reference)
+            with clones_lock:
+                clones_by_url[repo.url] = repo_source_path
+            with analysis_slots:
+                if failed.is_set():
+                    return
+                try:
+                    self.run_analysis(
+                        dataset.lang,
+                        repo_source_path,
+                        result_path / repo.name,
+                        show_progress=jobs == 1,
+                    )
+                except BaseException:
+                    # Set before the slot is released to the next repository
+                    failed.set()
+                    raise
+
+        with ThreadPoolExecutor(
+            max_workers=min(2 * jobs, len(pending_repos))
+        ) as executor:
+            futures = {
+                executor.submit(clone_and_analyze, repo): repo for repo in pending_repos
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    repo = futures[future]
+                    try:
+                        future.result()
+                    except GitCommandError:
+                        print(f"[red]Failed to clone {repo.name}, skipping...[/red]")
+                    else:
+                        print(f"[{done}/{len(futures)}] {repo.name} analyzed")
+            except BaseException:
+                # Also stop on KeyboardInterrupt: queued repositories are
+                # cancelled and cloned ones are not analyzed
+                failed.set()
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def clone_repo(
+        self, dataset: GitRepoDataset, repo: GitRepo, reference: Path | None = None
+    ) -> Path:
+        """Clone a repository of a dataset in the dataset directory.
 
-            if repo_source_path.is_dir():
-                shutil.rmtree(repo_source_path)
+        Args:
+            dataset: The `GitRepoDataset` the repository belongs to.
+            repo: The `GitRepo` to clone.
+            reference: Optional path to another clone of the same repository
+                to reuse objects from.
 
-            repo_source_path.mkdir()
-            repo.save(repo_source_path)
+        Returns:
+            The path to the source code of the repository.
 
-            self.run_analysis(dataset.lang, repo_source_path, repo_result_path)
+        """
+        repo_source_path = dataset.directory / repo.name
+        rmtree_in_background(repo_source_path)
+        repo_source_path.mkdir()
+        # Other files (configuration, templates, resources...) may be analyzed
+        # as well, only check out a subset of the files if the tool opts in
+        sparse_patterns = None
+        if self.sparse_checkout:
+            sparse_patterns = dataset.sparse_patterns.get(dataset.lang)
+        repo.save(repo_source_path, sparse_patterns, reference)
+        return repo_source_path
 
     @property
     def supported_dataset_full_names(self) -> list[str]:
@@ -327,29 +491,38 @@ class SAST(ABC):
             A sorted list of result directory names.
 
         """
+        dataset_full_names = {
+            dataset_full_name
+            for d in self.supported_datasets
+            for dataset_full_name in d.list_dataset_full_names()
+        }
         output_dirs = []
-        if self.output_dir.is_dir():
-            for result in self.output_dir.iterdir():
-                if result.is_dir():
-                    if (
-                        any(
-                            result.name in d.list_dataset_full_names()
-                            for d in self.supported_datasets
-                        )
-                        and dataset
-                    ):
-                        output_dirs.append(result.name)
-                    elif (
-                        not any(
-                            result.name in d.list_dataset_full_names()
-                            for d in self.supported_datasets
-                        )
-                        and project
-                    ):
-                        output_dirs.append(result.name)
+        for name in self.list_output_dirs():
+            if name in dataset_full_names:
+                if dataset:
+                    output_dirs.append(name)
+            elif project:
+                output_dirs.append(name)
 
         output_dirs = sorted(output_dirs)
-        return output_dirs
+        return output_dirs[:limit]
+
+    def list_output_dirs(self) -> list[str]:
+        """List the names of the result directories.
+
+        Returns:
+            The names of the (non-hidden) result directories.
+
+        """
+        try:
+            with os.scandir(self.output_dir) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir() and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
+            return []
 
 
 class BuildlessSAST(SAST):
@@ -408,12 +581,9 @@ Expected artifacts: \t[b]{str(dataset.directory / prebuilt_dir / prebuilt_glob)}
         result_path = self.output_dir / dataset.full_name
         result_path.mkdir(exist_ok=True, parents=True)
 
-        if result_path.is_dir():
-            if os.listdir(result_path) and not overwrite:
-                print(
-                    "Results already exist, please use --overwrite to delete old results"
-                )
-                return
+        if not overwrite and not is_empty_dir(result_path):
+            print("Results already exist, please use --overwrite to delete old results")
+            return
 
         self.run_analysis(
             dataset.lang,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 import shutil
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING, Any, Literal
 
 import typer
@@ -127,6 +128,25 @@ class Config(SASTRequirement):
         return (USER_CONFIG_DIR / self.sast_name / self.name).is_file()
 
 
+@cache
+def get_version_output(binary_name: str, command_flag: str) -> str:
+    """Get the output of the version command of a binary.
+
+    The command is run once per process, requirements are checked for both
+    the status and the missing requirements of each SAST tool.
+
+    Args:
+        binary_name: The name of the binary.
+        command_flag: The command line flag to get the version string.
+
+    Returns:
+        The output of the version command.
+
+    """
+    _, output = run_command([binary_name, command_flag], silent=True)
+    return output
+
+
 class BinaryVersion:
     """Represent a version requirement for a binary."""
 
@@ -153,7 +173,7 @@ class BinaryVersion:
             True if the version is sufficient, False otherwise.
 
         """
-        retcode, output = run_command([binary.name, self.command_flag], silent=True)
+        output = get_version_output(binary.name, self.command_flag)
         if m := re.search(self.pattern, output):
             detected_version = version.parse(m.group(1))
             return detected_version >= self.expected
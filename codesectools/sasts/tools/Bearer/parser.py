@@ -5,14 +5,16 @@ the JSON output from a Bearer scan, converting it into the standardized
 format used by CodeSecTools.
 """
 
-from itertools import chain
+from __future__ import annotations
 
-import yaml
+from typing import TYPE_CHECKING
 
-from codesectools.sasts.core.parser.format.SARIF import Result
 from codesectools.sasts.core.parser.format.SARIF.parser import SARIFAnalysisResult
 from codesectools.shared.cwe import CWE, CWEs
-from codesectools.utils import USER_CACHE_DIR
+from codesectools.utils import USER_CACHE_DIR, load_yaml_files
+
+if TYPE_CHECKING:
+    from codesectools.sasts.core.parser.format.SARIF import Result
 
 BEARER_RULES_DIR = USER_CACHE_DIR / "bearer-rules" / "rules"
 
@@ -21,25 +23,22 @@ class BearerAnalysisResult(SARIFAnalysisResult):
     """Represent the complete result of a Bearer analysis from a SARIF file."""
 
     sast_name = "Bearer"
+    # The CWEs are read from the downloaded rules
+    cache_dependencies = (BEARER_RULES_DIR.parent / ".complete",)
 
     @staticmethod
-    # @Cache(BEARER_RULES_DIR / ".cstools_cache").memoize(expire=None)
     def get_raw_rules() -> dict:
         """Load and return all Bearer rules from the cached YAML files."""
         raw_rules = {}
         if BEARER_RULES_DIR.is_dir():
-            rule_paths = chain(
-                BEARER_RULES_DIR.rglob("*.yml"), BEARER_RULES_DIR.rglob("*.yaml")
-            )
-            for rule_path in rule_paths:
+            for data in load_yaml_files(BEARER_RULES_DIR).values():
                 try:
-                    data = yaml.safe_load(rule_path.open("r"))
                     rule_id = data["metadata"]["id"]
                     raw_rules[rule_id] = data
 
                     for aux in data.get("auxiliary", []):
                         raw_rules[aux["id"]] = data
-                except (TypeError, KeyError, yaml.composer.ComposerError):  # ty:ignore[possibly-missing-submodule]
+                except (TypeError, KeyError):
                     pass
         return raw_rules
 
@@ -1,17 +1,20 @@
 """Provide a base parser for SAST tools that output in SARIF format."""
 
-import json
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from codesectools.sasts.core.parser import AnalysisResult, Defect
-from codesectools.sasts.core.parser.format.CoverityJsonOutputV10 import (
-    CoverityJsonOutputV10,
-)
 from codesectools.sasts.core.sast import AnalysisInfo
 from codesectools.shared.cwe import CWEs
 from codesectools.utils import MissingFile
 
+if TYPE_CHECKING:
+    from codesectools.sasts.core.parser.format.CoverityJsonOutputV10 import (
+        CoverityJsonOutputV10,
+    )
+
 
 class CoverityAnalysisResult(AnalysisResult):
     """Represent the complete result of a Coverity analysis."""
@@ -25,13 +28,16 @@ class CoverityAnalysisResult(AnalysisResult):
     }
 
     def __init__(
-        self, output_dir: Path, coverity_dict: dict, analysis_info: AnalysisInfo
+        self,
+        output_dir: Path,
+        cov_json: CoverityJsonOutputV10,
+        analysis_info: AnalysisInfo,
     ) -> None:
         """Initialize a CoverityAnalysisResult instance.
 
         Args:
             output_dir: The directory containing the analysis output.
-            coverity_dict: The parsed Coverity JSON dictionary.
+            cov_json: The validated Coverity JSON report.
             analysis_info: The analysis metadata.
 
         """
@@ -45,10 +51,9 @@ class CoverityAnalysisResult(AnalysisResult):
         )
 
         self.output_dir = output_dir
-        self.cov_json = CoverityJsonOutputV10.model_validate(coverity_dict)
-        self.issues = self.cov_json.issues
 
-        for issue in self.issues:
+        # The validated report is not kept once the defects are extracted
+        for issue in cov_json.issues:
             if issue.language:
                 if issue.language.lower() != self.lang:
                     continue
@@ -90,16 +95,23 @@ class CoverityAnalysisResult(AnalysisResult):
     @classmethod
     def load_from_output_dir(cls, output_dir: Path) -> Self:
         """Load and parse a SARIF report from an output directory."""
+        from codesectools.sasts.core.parser.format.CoverityJsonOutputV10 import (
+            CoverityJsonOutputV10,
+        )
+
         # Analysis Info
         analysis_info = AnalysisInfo.model_validate_json(
-            (output_dir / "codesectools.json").read_text()
+            (output_dir / "codesectools.json").read_bytes()
         )
 
         # Analysis outputs
         coveirty_report_path = output_dir / "coverity.json"
         if coveirty_report_path.is_file():
-            coverity_dict = json.load(coveirty_report_path.open())
+            # Validate the raw bytes directly instead of building a dict first
+            cov_json = CoverityJsonOutputV10.model_validate_json(
+                coveirty_report_path.read_bytes()
+            )
         else:
             raise MissingFile([str(coveirty_report_path)])
 
-        return cls(output_dir, coverity_dict, analysis_info)
+        return cls(output_dir, cov_json, analysis_info)
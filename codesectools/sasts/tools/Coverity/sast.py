@@ -29,6 +29,8 @@ class CoveritySAST(BuildlessSAST):
         output_files (list[tuple[Path, bool]]): A list of expected output files and
             whether they are required.
         parser (type[CoverityAnalysisResult]): The parser class for the tool's results.
+        sparse_checkout (bool): Whether only the sources and build files of
+            dataset repositories are checked out.
 
     """
 
@@ -75,3 +77,4 @@ class CoveritySAST(BuildlessSAST):
     valid_codes = [0]
     output_files = [(Path("coverity.json"), True)]
     parser = CoverityAnalysisResult
+    sparse_checkout = True
@@ -7,7 +7,6 @@ format used by CodeSecTools.
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 from codesectools.sasts.core.parser.format.SARIF.parser import SARIFAnalysisResult
@@ -27,8 +26,5 @@ class CppcheckAnalysisResult(SARIFAnalysisResult):
         """Get the CWE for a given rule ID."""
         if rule_properties := self.get_rule_properties(rule_id):
             if tags := rule_properties.tags:
-                for tag in tags:
-                    if m := re.search(r"cwe-(\d+)", tag.lower()):
-                        cwe_id = int(m.group(1))
-                        return CWEs.from_id(cwe_id)
+                return self.cwe_from_tags(tags)
         return CWEs.NOCWE
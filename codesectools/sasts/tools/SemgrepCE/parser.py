@@ -5,17 +5,18 @@ the JSON output from a Semgrep scan, converting it into the standardized
 format used by CodeSecTools.
 """
 
-import os
-import re
-from itertools import chain
-from typing import Any
+from __future__ import annotations
 
-import yaml
+import json
+import os
+from typing import TYPE_CHECKING
 
-from codesectools.sasts.core.parser.format.SARIF import Result
 from codesectools.sasts.core.parser.format.SARIF.parser import SARIFAnalysisResult
 from codesectools.shared.cwe import CWE, CWEs
-from codesectools.utils import USER_CACHE_DIR
+from codesectools.utils import USER_CACHE_DIR, load_yaml_files
+
+if TYPE_CHECKING:
+    from codesectools.sasts.core.parser.format.SARIF import Result
 
 SEMGREP_RULES_DIR = USER_CACHE_DIR / "semgrep-rules"
 
@@ -24,6 +25,8 @@ class SemgrepCEAnalysisResult(SARIFAnalysisResult):
     """Represent the complete result of a SemgrepCE analysis from a SARIF file."""
 
     sast_name = "SemgrepCE"
+    # The CWEs are read from the downloaded rules
+    cache_dependencies = (SEMGREP_RULES_DIR / ".complete",)
     rule_categories = [
         "best-practice",
         "correctness",
@@ -37,41 +40,34 @@ class SemgrepCEAnalysisResult(SARIFAnalysisResult):
     # home.michel..codesectools.cache.semgrep-rules.java.android.best-practice.manifest-usesCleartextTraffic-true
     # Removing the path to rules to keep only the real rule id:
     # java.android.best-practice.manifest-usesCleartextTraffic-true
-    def patch_dict(self, sarif_dict: dict) -> dict:
-        """Patch the SARIF dictionary to shorten rule IDs."""
+    @classmethod
+    def patch_report(cls, sarif_report: bytes) -> bytes:
+        """Patch the raw SARIF report to shorten rule IDs."""
         rule_path_pattern = str(SEMGREP_RULES_DIR).replace(os.sep, ".")[1:] + "."
+        # The pattern may appear as raw UTF-8 or JSON escaped in the report
+        for encoded_pattern in {
+            rule_path_pattern.encode(),
+            json.dumps(rule_path_pattern)[1:-1].encode(),
+        }:
+            sarif_report = sarif_report.replace(encoded_pattern, b"")
+        return sarif_report
 
-        def recursive_patch(data: Any) -> None:  # noqa: ANN401
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    if isinstance(value, str) and rule_path_pattern in value:
-                        data[key] = value.replace(rule_path_pattern, "")
-                    else:
-                        recursive_patch(value)
-            elif isinstance(data, list):
-                for item in data:
-                    recursive_patch(item)
-
-        recursive_patch(sarif_dict)
+    def patch_dict(self, sarif_dict: dict) -> dict:
+        """Save the patched SARIF dictionary (debug mode only)."""
         self.save_patched_dict(sarif_dict)
         return sarif_dict
 
     @staticmethod
-    # @Cache(SEMGREP_RULES_DIR / ".cstools_cache").memoize(expire=None)
     def get_raw_rules() -> dict:
         """Load and return all Semgrep rules from the cached YAML files."""
         raw_rules = {}
         if SEMGREP_RULES_DIR.is_dir():
-            rule_paths = chain(
-                SEMGREP_RULES_DIR.rglob("*.yml"), SEMGREP_RULES_DIR.rglob("*.yaml")
-            )
-            for rule_path in rule_paths:
+            for data in load_yaml_files(SEMGREP_RULES_DIR).values():
                 try:
-                    data = yaml.safe_load(rule_path.open("r"))
                     for rule in data.get("rules"):
                         rule_id = rule["id"]
                         raw_rules[rule_id] = rule
-                except (TypeError, KeyError, yaml.composer.ComposerError):  # ty:ignore[possibly-missing-submodule]
+                except (TypeError, KeyError):
                     pass
         return raw_rules
 
@@ -79,8 +75,5 @@ class SemgrepCEAnalysisResult(SARIFAnalysisResult):
         """Get the CWE for a given rule ID."""
         if rule_properties := self.get_rule_properties(rule_id):
             if tags := rule_properties.tags:
-                for tag in tags:
-                    if m := re.search(r"cwe-(\d+)", tag.lower()):
-                        cwe_id = int(m.group(1))
-                        return CWEs.from_id(cwe_id)
+                return self.cwe_from_tags(tags)
         return CWEs.NOCWE
@@ -5,12 +5,16 @@ the SARIF JSON output from a Snyk Code scan, converting it into the standardized
 format used by CodeSecTools.
 """
 
-import re
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-from codesectools.sasts.core.parser.format.SARIF import Result
 from codesectools.sasts.core.parser.format.SARIF.parser import SARIFAnalysisResult
 from codesectools.shared.cwe import CWE, CWEs
 
+if TYPE_CHECKING:
+    from codesectools.sasts.core.parser.format.SARIF import Result
+
 
 class SnykCodeAnalysisResult(SARIFAnalysisResult):
     """Represent the complete result of a Snyk Code analysis from a SARIF file."""
@@ -23,7 +27,5 @@ class SnykCodeAnalysisResult(SARIFAnalysisResult):
         if rule_properties := self.get_rule_properties(rule_id):
             if extra := rule_properties.__pydantic_extra__:
                 if cwe := extra.get("cwe"):
-                    if m := re.search(r"cwe-(\d+)", cwe[0].lower()):
-                        cwe_id = int(m.group(1))
-                        return CWEs.from_id(cwe_id)
+                    return self.cwe_from_tags(cwe[:1])
         return CWEs.NOCWE
@@ -34,23 +34,28 @@ class SpotBugsAnalysisResult(SARIFAnalysisResult):
         for file_path in self.source_path.rglob("*.java"):  # SpotBugs only support Java
             file_index[file_path.name].append(file_path)
 
+        # The same classes are reported many times, resolve each uri once
+        resolved_uris: dict[str, str | None] = {}
+
+        def resolve_uri(uri: str) -> str | None:
+            partial_filepath = Path(uri)
+            candidates = file_index.get(partial_filepath.name, [])
+
+            for candidate in candidates:
+                if (
+                    candidate.parts[-len(partial_filepath.parts) :]
+                    == partial_filepath.parts
+                ):
+                    return str(candidate.resolve())
+            return None
+
         def recursive_patch(data: Any) -> None:  # noqa: ANN401
             if isinstance(data, dict):
                 for key, value in data.items():
                     if key == "uri":
-                        partial_filepath = Path(value)
-                        candidates = file_index.get(partial_filepath.name, [])
-
-                        found = None
-                        for candidate in candidates:
-                            if (
-                                candidate.parts[-len(partial_filepath.parts) :]
-                                == partial_filepath.parts
-                            ):
-                                found = str(candidate.resolve())
-                                break
-
-                        data[key] = found if found else None
+                        if value not in resolved_uris:
+                            resolved_uris[value] = resolve_uri(value)
+                        data[key] = resolved_uris[value]
                     else:
                         recursive_patch(value)
 
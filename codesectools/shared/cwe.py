@@ -12,6 +12,11 @@ from typing import Self
 
 from codesectools.utils import USER_CACHE_DIR
 
+# Compiled once, these are matched for every CWE or every defect
+QUOTED_NAME_PATTERN = re.compile(r"\('(.*)'\)")
+CHILD_OF_PATTERN = re.compile(r"NATURE:ChildOf:CWE ID:(\d+):")
+CWE_ID_PATTERN = re.compile(r"CWE-(\d+)", re.IGNORECASE)
+
 
 class CWE:
     """Represent a single Common Weakness Enumeration.
@@ -46,7 +51,7 @@ class CWE:
         if children is None:
             children = set()
         self.id = id
-        if r := re.search(r"\('(.*)'\)", name):
+        if r := QUOTED_NAME_PATTERN.search(name):
             self.name = r.group(1)
             self.full_name = name
         else:
@@ -78,6 +83,14 @@ class CWE:
         """Return the hash of the CWE instance, based on its ID."""
         return hash(self.id)
 
+    def __reduce__(self) -> tuple:
+        """Pickle the CWE by its identifier only.
+
+        The CWE is looked up in the collection when unpickled instead of
+        serializing the whole hierarchy it is linked to.
+        """
+        return (get_cwe, (self.id,))
+
     def __repr__(self) -> str:
         """Return a developer-friendly string representation of the CWE.
 
@@ -138,6 +151,7 @@ class CWEsCollection:
         self.directory = USER_CACHE_DIR / "cwe"
         self.NOCWE = CWE(id=-1, name="	Missing or invalid CWE", description="None")
         self._cwes = None
+        self._from_string_cache: dict[str, CWE] = {}
 
         if not self.directory.is_dir():
             self.download()
@@ -151,30 +165,43 @@ class CWEsCollection:
         return self._cwes
 
     def download(self) -> None:
-        """Download CWE data from the official MITRE website."""
+        """Download CWE data from the official MITRE website.
+
+        The files are fetched concurrently over a shared HTTP session, and only
+        written once all of them have been retrieved.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
         import requests
         from rich.progress import Progress
 
-        with Progress() as progress:
+        urls = {
+            filename: f"https://cwe.mitre.org/data/csv/{filename}.zip"
+            for filename in self.cwes_data.values()
+            if not (self.directory / filename).is_file()
+        }
+        urls["termsofuse.html"] = "https://cwe.mitre.org/about/termsofuse.html"
+
+        with Progress() as progress, requests.Session() as session:
             task = progress.add_task(
-                "[red]Downloading CWEs from [b]cwe.mitre.org[/b]...", total=100
+                "[red]Downloading CWEs from [b]cwe.mitre.org[/b]...", total=len(urls)
             )
-            for filename in self.cwes_data.values():
-                if not (self.directory / filename).is_file():
-                    zip_file = io.BytesIO(
-                        requests.get(
-                            f"https://cwe.mitre.org/data/csv/{filename}.zip"
-                        ).content
-                    )
-                    with zipfile.ZipFile(zip_file, "r") as zip_ref:
-                        zip_ref.extract(filename, self.directory)
-                progress.update(task, advance=25)
 
-            terms_file = self.directory / "termsofuse.html"
-            terms_file.write_bytes(
-                requests.get("https://cwe.mitre.org/about/termsofuse.html").content
-            )
-            progress.update(task, advance=25)
+            def fetch(url: str) -> bytes:
+                content = session.get(url).content
+                progress.update(task, advance=1)
+                return content
+
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                contents = dict(
+                    zip(urls, executor.map(fetch, urls.values()), strict=True)
+                )
+
+        terms_content = contents.pop("termsofuse.html")
+        for filename, content in contents.items():
+            with zipfile.ZipFile(io.BytesIO(content), "r") as zip_ref:
+                zip_ref.extract(filename, self.directory)
+        (self.directory / "termsofuse.html").write_bytes(terms_content)
 
     def load(self) -> dict[int, CWE]:
         """Load and parse CWE data from cached CSV files.
@@ -190,28 +217,35 @@ class CWEsCollection:
         cwes_parent = {}
         cwes_children = {}
         for filename in self.cwes_data.values():
-            reader = csv.DictReader((self.directory / filename).open(encoding="utf-8"))
-            for cwe_dict in reader:
-                cwe_id = int(cwe_dict["CWE-ID"])
-
-                cwes[cwe_id] = CWE(
-                    id=cwe_id,
-                    name=cwe_dict["Name"],
-                    description=cwe_dict["Description"],
-                )
+            with (self.directory / filename).open(encoding="utf-8") as f:
+                # Index the few needed columns instead of building a dict per row
+                reader = csv.reader(f)
+                header = next(reader)
+                id_index = header.index("CWE-ID")
+                name_index = header.index("Name")
+                description_index = header.index("Description")
+                related_index = header.index("Related Weaknesses")
+                for row in reader:
+                    cwe_id = int(row[id_index])
+
+                    cwes[cwe_id] = CWE(
+                        id=cwe_id,
+                        name=row[name_index],
+                        description=row[description_index],
+                    )
 
-                for related in cwe_dict["Related Weaknesses"].split("::"):
-                    if m := re.search(r"NATURE:ChildOf:CWE ID:(\d+):", related):
-                        parent_id = int(m.group(1))
+                    for related in row[related_index].split("::"):
+                        if m := CHILD_OF_PATTERN.search(related):
+                            parent_id = int(m.group(1))
 
-                        cwes_parent[cwe_id] = parent_id
+                            cwes_parent[cwe_id] = parent_id
 
-                        if cwes_children.get(parent_id):
-                            cwes_children[parent_id].add(cwe_id)
-                        else:
-                            cwes_children[parent_id] = {cwe_id}
+                            if cwes_children.get(parent_id):
+                                cwes_children[parent_id].add(cwe_id)
+                            else:
+                                cwes_children[parent_id] = {cwe_id}
 
-                        break
+                            break
 
         for cwe_id, cwe in cwes.items():
             if p_id := cwes_parent.get(cwe_id):
@@ -232,10 +266,14 @@ class CWEsCollection:
             The corresponding CWE object, or a default 'Invalid CWE' object if the string is malformed.
 
         """
-        if match := re.search(r"[CWE|cwe]-(\d+)", cwe_string):
-            return self.from_id(int(match.group(1)))
-        else:
-            return self.NOCWE
+        # The same strings are looked up for many defects and dataset rows
+        if (cwe := self._from_string_cache.get(cwe_string)) is None:
+            if match := CWE_ID_PATTERN.search(cwe_string):
+                cwe = self.from_id(int(match.group(1)))
+            else:
+                cwe = self.NOCWE
+            self._from_string_cache[cwe_string] = cwe
+        return cwe
 
     def from_id(self, cwe_id: int) -> CWE:
         """Get a CWE by its identifier.
@@ -251,3 +289,8 @@ class CWEsCollection:
 
 
 CWEs = CWEsCollection()
+
+
+def get_cwe(cwe_id: int) -> CWE:
+    """Get a CWE of the collection by its identifier, used to unpickle CWEs."""
+    return CWEs.from_id(cwe_id)
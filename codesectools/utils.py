@@ -6,11 +6,14 @@ standardized error reporting.
 """
 
 import os
-import re
+import shutil
 import subprocess
-from collections.abc import Sequence
+import threading
+import uuid
+from collections.abc import Iterator, Sequence
 from importlib.resources import files
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -52,8 +55,12 @@ def get_pattern(arg: str, mapping: dict[str, str]) -> str | None:
         The found pattern string (e.g., '{placeholder}') or None if not found.
 
     """
-    if m := re.search(r"\{.*\}", arg):
-        return m.group(0)
+    # Same as re.search(r"\{.*\}", arg) without the regex engine: "." does
+    # not match newlines, so each line is searched on its own
+    for line in arg.split("\n"):
+        start, end = line.find("{"), line.rfind("}")
+        if start != -1 and end > start:
+            return line[start : end + 1]
 
 
 def render_command(command: list, mapping: dict[str, str]) -> list[str]:
@@ -146,18 +153,21 @@ def run_command(
         env=modified_env,
     )
 
-    stdout = ""
+    chunks = []
 
     if process.stdout:
-        for line in process.stdout:
-            stdout += line
-            if DEBUG() and not silent:
+        if DEBUG() and not silent:
+            for line in process.stdout:
+                chunks.append(line)
                 click.echo(line, nl=False)
+        else:
+            # Nothing to display, read the output by large blocks
+            chunks.append(process.stdout.read())
 
     process.wait()
     retcode = process.poll()
 
-    return (retcode, stdout)
+    return (retcode, "".join(chunks))
 
 
 # Custom Exceptions
@@ -259,4 +269,149 @@ def shorten_path(path: str, max_len: int = 20) -> str:
     return str(shortened_path)
 
 
+def is_empty_dir(path: Path) -> bool:
+    """Check if a directory is empty or does not exist.
+
+    Only the first entry of the directory is read.
+
+    Args:
+        path: The directory to check.
+
+    Returns:
+        True if the directory has no entries or does not exist, False otherwise.
+
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+
+
+def find_files(directory: Path, suffixes: tuple[str, ...]) -> Iterator[Path]:
+    """Find the files with any of the given suffixes in a directory tree.
+
+    The tree is walked once whatever the number of suffixes.
+
+    Args:
+        directory: The root of the directory tree.
+        suffixes: The file name suffixes to look for (e.g. `(".yml", ".yaml")`).
+
+    Yields:
+        The paths of the matching files.
+
+    """
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if filename.endswith(suffixes):
+                yield Path(dirpath, filename)
+
+
+def load_yaml_files(directory: Path) -> dict[str, Any]:
+    """Load the YAML files of a directory tree, caching the parsed documents.
+
+    Parsed documents are pickled in the user cache, outside of the directory
+    tree which may be a third-party checkout, along with the modification time
+    and size of their file; only new or modified files are parsed again.
+
+    Args:
+        directory: The root of the directory tree.
+
+    Returns:
+        A mapping of the file paths to their parsed document. Files that do
+        not contain a single document are left out.
+
+    """
+    import pickle
+    from hashlib import sha256
+
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+    # One cache per directory tree, named after its path
+    cache_key = sha256(str(directory.resolve()).encode()).hexdigest()
+    cache_dir = USER_CACHE_DIR / "yaml"
+    cache_file = cache_dir / f"{cache_key}.pkl"
+    try:
+        with cache_file.open("rb") as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.PickleError):
+        cache = {}
+
+    entries = {}
+    updated = False
+    for path in find_files(directory, (".yml", ".yaml")):
+        key = str(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = cache.get(key)
+        if entry is None or entry[0] != stamp:
+            try:
+                entry = (stamp, True, yaml.load(path.read_bytes(), Loader=SafeLoader))
+            except yaml.composer.ComposerError:  # ty:ignore[possibly-missing-submodule]
+                entry = (stamp, False, None)
+            updated = True
+        entries[key] = entry
+
+    if updated or len(entries) != len(cache):
+        temp_file = cache_dir / f"{cache_key}.{uuid.uuid4().hex}.tmp"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with temp_file.open("wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except (OSError, pickle.PickleError):
+            temp_file.unlink(missing_ok=True)
+
+    return {key: data for key, (_, parsed, data) in entries.items() if parsed}
+
+
+def read_files(filepaths: Sequence[Path], batch_size: int = 256) -> Iterator[bytes]:
+    """Read the content of many files concurrently.
+
+    Reads are I/O-bound and overlapped by a thread pool. Files are read a
+    batch at a time so that contents are not read far ahead of the consumer.
+
+    Args:
+        filepaths: The paths of the files to read.
+        batch_size: The maximum number of files read ahead.
+
+    Yields:
+        The content of each file, in the order of `filepaths`.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, CPU_COUNT * 4)) as executor:
+        for start in range(0, len(filepaths), batch_size):
+            yield from executor.map(
+                Path.read_bytes, filepaths[start : start + batch_size]
+            )
+
+
+def rmtree_in_background(path: Path) -> None:
+    """Remove a directory tree without waiting for the removal to complete.
+
+    The directory is renamed to a hidden sibling, so that its path can be
+    reused right away, and then removed by a background thread. The thread is
+    not a daemon: the interpreter waits for the removal before exiting.
+
+    Args:
+        path: The directory to remove, nothing is done if it does not exist.
+
+    """
+    trash_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.old")
+    try:
+        path.rename(trash_path)
+    except FileNotFoundError:
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash_path,), kwargs={"ignore_errors": True}
+    ).start()
+
+
 CPU_COUNT = os.cpu_count() or 2
@@ -0,0 +1,263 @@
+"""Test the core SAST logic without running any SAST tool."""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import typer
+from git.exc import GitCommandError
+from typer.testing import CliRunner
+from typing_extensions import Annotated
+
+from codesectools.sasts.core.cli import LazyChoice
+from codesectools.sasts.core.sast import SAST, AnalysisInfo
+from codesectools.utils import MissingFile
+
+
+class FakeSAST(SAST):
+    """A SAST tool whose outputs are written by the tests."""
+
+    name = "Fake"
+    output_files = [
+        (Path("report.json"), True),
+        (Path("logs", "*.log"), False),
+    ]
+
+    def __init__(self, output_dir: Path) -> None:
+        """Initialize the fake SAST without checking any requirement."""
+        self.output_dir = output_dir
+
+
+ANALYSIS_INFO = AnalysisInfo(
+    project_dir="/project",
+    lang="java",
+    command_lines=[],
+    logs="",
+    duration=0.0,
+    lines_of_codes=0,
+)
+
+
+@pytest.fixture
+def sast(tmp_path: Path) -> FakeSAST:
+    """Create a fake SAST saving its results in a temporary directory."""
+    return FakeSAST(tmp_path / "output")
+
+
+def test_save_results(sast: FakeSAST, tmp_path: Path) -> None | AssertionError:
+    """Test that new results replace the previous ones."""
+    project_dir = tmp_path / "project"
+    (project_dir / "logs").mkdir(parents=True)
+    (project_dir / "report.json").write_text("new")
+    (project_dir / "logs" / "run.log").write_text("log")
+
+    output_dir = sast.output_dir / "project"
+    output_dir.mkdir(parents=True)
+    (output_dir / "report.json").write_text("old")
+    (output_dir / "old.log").write_text("old")
+
+    sast.save_results(project_dir, output_dir, ANALYSIS_INFO)
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "codesectools.json",
+        "report.json",
+        "run.log",
+    ]
+    assert (output_dir / "report.json").read_text() == "new"
+    assert not (project_dir / "report.json").exists()
+    assert not list(sast.output_dir.glob(".*.new"))
+
+
+def test_save_results_missing_file(
+    sast: FakeSAST, tmp_path: Path
+) -> None | AssertionError:
+    """Test that previous results are kept if a required output is missing."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+
+    output_dir = sast.output_dir / "project"
+    output_dir.mkdir(parents=True)
+    (output_dir / "report.json").write_text("old")
+
+    with pytest.raises(MissingFile):
+        sast.save_results(project_dir, output_dir, ANALYSIS_INFO)
+    assert [path.name for path in output_dir.iterdir()] == ["report.json"]
+    assert (output_dir / "report.json").read_text() == "old"
+    assert not list(sast.output_dir.glob(".*"))
+
+
+def test_save_results_failed_move(
+    sast: FakeSAST, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None | AssertionError:
+    """Test that the staging directory is removed if saving the results fails."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "report.json").write_text("new")
+
+    output_dir = sast.output_dir / "project"
+    output_dir.mkdir(parents=True)
+    (output_dir / "report.json").write_text("old")
+
+    def failing_move(src: Path, dst: Path) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("shutil.move", failing_move)
+    with pytest.raises(OSError):
+        sast.save_results(project_dir, output_dir, ANALYSIS_INFO)
+    assert (output_dir / "report.json").read_text() == "old"
+    assert not list(sast.output_dir.glob(".*"))
+
+
+@pytest.mark.parametrize(
+    ("sparse_checkout", "expected"), [(False, None), (True, ["*.java"])]
+)
+def test_clone_repo_sparse_checkout(
+    sast: FakeSAST,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sparse_checkout: bool,
+    expected: list[str] | None,
+) -> None | AssertionError:
+    """Test that only the SAST tools opting in get a sparse checkout."""
+    saved = []
+    repo = SimpleNamespace(
+        name="repo", save=lambda *args: saved.append(args), size=0, url=""
+    )
+    dataset = SimpleNamespace(
+        directory=tmp_path, lang="java", sparse_patterns={"java": ["*.java"]}
+    )
+    monkeypatch.setattr(sast, "sparse_checkout", sparse_checkout)
+
+    sast.clone_repo(dataset, repo)
+    assert saved == [(tmp_path / "repo", expected, None)]
+
+
+def test_lazy_choice() -> None | AssertionError:
+    """Test that choices are computed each time a command line is parsed."""
+    results = ["old"]
+    app = typer.Typer()
+
+    @app.command()
+    def plot(
+        result: Annotated[str, typer.Argument(click_type=LazyChoice(lambda: results))],
+    ) -> None:
+        print(result)
+
+    runner = CliRunner()
+    assert runner.invoke(app, ["old"]).exit_code == 0
+    assert runner.invoke(app, ["new"]).exit_code == 2
+
+    results.append("new")
+    result = runner.invoke(app, ["new"])
+    assert result.exit_code == 0
+    assert result.output == "new\n"
+
+
+class RepoSAST(FakeSAST):
+    """A fake SAST recording the repositories it clones and analyzes."""
+
+    def __init__(self, output_dir: Path, fail_on: dict[str, BaseException]) -> None:
+        """Initialize the fake SAST with the errors to raise for some repositories."""
+        super().__init__(output_dir)
+        self.fail_on = fail_on
+        self.analyzed = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def clone_repo(
+        self, dataset: SimpleNamespace, repo: SimpleNamespace, reference: Path | None
+    ) -> Path:
+        """Fail to clone the repositories whose clone error is set."""
+        if isinstance(error := self.fail_on.get(repo.name), GitCommandError):
+            raise error
+        repo_source_path = dataset.directory / repo.name
+        repo_source_path.mkdir(parents=True, exist_ok=True)
+        (repo_source_path / "report.json").write_text(repo.name)
+        return repo_source_path
+
+    def run_analysis(
+        self, lang: str, project_dir: Path, output_dir: Path, **kwargs: object
+    ) -> None:
+        """Record the analysis, raising the error set for the repository if any."""
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.05)
+            if error := self.fail_on.get(project_dir.name):
+                raise error
+            self.save_results(project_dir, output_dir, ANALYSIS_INFO)
+            self.analyzed.append(project_dir.name)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def make_dataset(tmp_path: Path, count: int) -> SimpleNamespace:
+    """Create a fake dataset of repositories, listed from the largest."""
+    repos = [
+        SimpleNamespace(name=f"repo{index}", url=f"https://repo{index}", size=index)
+        for index in reversed(range(count))
+    ]
+    return SimpleNamespace(
+        full_name="Fake_java", lang="java", directory=tmp_path / "repos", repos=repos
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_analyze_repos_jobs(tmp_path: Path, jobs: int) -> None | AssertionError:
+    """Test that all repositories are analyzed, at most `jobs` at a time."""
+    sast = RepoSAST(tmp_path / "output", fail_on={})
+    sast.analyze_repos(make_dataset(tmp_path, 8), jobs=jobs)
+    assert sorted(sast.analyzed) == [f"repo{index}" for index in range(8)]
+    assert sast.max_running <= jobs
+
+
+def test_analyze_repos_limit(tmp_path: Path) -> None | AssertionError:
+    """Test that only the smallest repositories are analyzed."""
+    sast = RepoSAST(tmp_path / "output", fail_on={})
+    sast.analyze_repos(make_dataset(tmp_path, 8), limit=3)
+    assert sorted(sast.analyzed) == ["repo0", "repo1", "repo2"]
+
+
+def test_analyze_repos_skipped(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None | AssertionError:
+    """Test that existing results are skipped and reported at once."""
+    sast = RepoSAST(tmp_path / "output", fail_on={})
+    dataset = make_dataset(tmp_path, 8)
+    sast.analyze_repos(dataset, limit=7)
+    capsys.readouterr()
+
+    sast.analyze_repos(dataset)
+    assert sast.analyzed[7:] == ["repo7"]
+    output = capsys.readouterr().out
+    assert output.count("Results already exist") == 1
+    assert "for 7 repositories" in output
+
+    sast.analyze_repos(dataset, overwrite=True)
+    assert len(sast.analyzed) == 16
+    assert (sast.output_dir / "Fake_java" / "repo0" / "report.json").is_file()
+
+
+def test_analyze_repos_clone_failure(tmp_path: Path) -> None | AssertionError:
+    """Test that repositories failing to clone are skipped."""
+    sast = RepoSAST(
+        tmp_path / "output", fail_on={"repo1": GitCommandError("clone", 128)}
+    )
+    sast.analyze_repos(make_dataset(tmp_path, 4))
+    assert sorted(sast.analyzed) == ["repo0", "repo2", "repo3"]
+
+
+@pytest.mark.parametrize("error", [RuntimeError("failed"), KeyboardInterrupt()])
+def test_analyze_repos_stop(
+    tmp_path: Path, error: BaseException
+) -> None | AssertionError:
+    """Test that a failed or interrupted analysis stops the remaining ones."""
+    sast = RepoSAST(tmp_path / "output", fail_on={"repo9": error})
+    with pytest.raises(type(error)):
+        sast.analyze_repos(make_dataset(tmp_path, 10))
+    # Only the other repository cloned in advance may be analyzed first
+    assert len(sast.analyzed) <= 1
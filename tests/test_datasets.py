@@ -0,0 +1,122 @@
+"""Test the datasets without downloading them."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from codesectools.datasets import DATASETS_ALL, LazyDatasetLoader
+from codesectools.datasets.core.dataset import GitRepo
+from codesectools.datasets.CVEfixes.dataset import first_parent
+
+
+@pytest.mark.parametrize("dataset_name", sorted(DATASETS_ALL))
+def test_is_cached(
+    dataset_name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None | AssertionError:
+    """Test that a dataset has the same cache status before and after loading."""
+    monkeypatch.setattr("codesectools.datasets.core.dataset.USER_CACHE_DIR", tmp_path)
+    loader = LazyDatasetLoader(dataset_name)
+    assert not loader.is_cached()
+    assert not loader.loaded
+
+    (tmp_path / dataset_name).mkdir()
+    (tmp_path / dataset_name / ".complete").write_bytes(b"\x42")
+    assert loader.is_cached()
+    assert not loader.loaded
+
+    assert loader.name == dataset_name
+    assert loader.supported_languages
+    assert loader.loaded
+    assert loader.is_cached()
+
+
+@pytest.mark.parametrize(
+    ("parents", "expected"),
+    [
+        ("['3c9ef5a0b1d2']", "3c9ef5a0b1d2"),
+        ("['3c9ef5a0b1d2', '8d1f2e3a4b5c']", "3c9ef5a0b1d2"),
+        ('["3c9ef5a0b1d2"]', "3c9ef5a0b1d2"),
+        ("[ '3c9ef5a0b1d2' ]", "3c9ef5a0b1d2"),
+    ],
+)
+def test_first_parent(parents: str, expected: str) -> None | AssertionError:
+    """Test that the first parent commit is read from the CSV field."""
+    assert first_parent(parents) == expected
+
+
+@pytest.fixture
+def served_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> GitRepo:
+    """Create a bare repository whose analyzed commit is not a branch tip."""
+    from git import Repo
+
+    for variable in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{variable}_NAME", "CodeSecTools")
+        monkeypatch.setenv(f"GIT_{variable}_EMAIL", "cstools@example.com")
+
+    source = Repo.init(tmp_path / "source")
+    source.git.checkout("-b", "main")
+    for filename in ("main.c", "vuln.c", "fix.c"):
+        (tmp_path / "source" / filename).write_text(f"// {filename}\n")
+        source.git.add(filename)
+        source.git.commit("-m", filename)
+        if filename == "main.c":
+            source.git.checkout("-b", "fix")
+    vulnerable_commit = source.git.rev_parse("HEAD~1")
+    source.git.checkout("main")
+
+    bare = Repo.clone_from(source.working_dir, tmp_path / "bare.git", bare=True)
+    bare.git.config("uploadpack.allowFilter", "true")
+    return GitRepo(
+        name="served",
+        url=f"file://{tmp_path / 'bare.git'}",
+        commit=vulnerable_commit,
+        size=0,
+        cwes=[],
+        files=["vuln.c"],
+        has_vuln=True,
+    )
+
+
+def test_save_unadvertised_commit(
+    served_repo: GitRepo, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None | AssertionError:
+    """Test cloning a commit that the server does not allow to fetch by hash."""
+    # Protocol v0 only serves the advertised commits, like some servers do
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.version")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "0")
+    served_repo.save(tmp_path / "clone")
+    assert sorted(path.name for path in (tmp_path / "clone").glob("*.c")) == [
+        "main.c",
+        "vuln.c",
+    ]
+
+
+@pytest.mark.parametrize("commit", ["fix", "fix~1"])
+def test_save_with_reference(
+    served_repo: GitRepo, commit: str, tmp_path: Path
+) -> None | AssertionError:
+    """Test that a clone borrowing objects from a sibling is self-contained."""
+    from git import Repo
+
+    served_repo.save(tmp_path / "reference")
+    sibling_repo = GitRepo(
+        name="sibling",
+        url=served_repo.url,
+        commit=Repo(tmp_path / "source").git.rev_parse(commit),
+        size=0,
+        cwes=[],
+        files=["vuln.c"],
+        has_vuln=True,
+    )
+    sibling_repo.save(tmp_path / "clone", reference=tmp_path / "reference")
+
+    # Neither the reference nor the remote are needed anymore
+    shutil.rmtree(tmp_path / "reference")
+    shutil.rmtree(tmp_path / "bare.git")
+    clone = Repo(tmp_path / "clone")
+    assert not Path(clone.git_dir, "objects", "info", "alternates").exists()
+    objects = clone.git.rev_list("--objects", "--missing=print", "HEAD")
+    assert not [line for line in objects.splitlines() if line.startswith("?")]
+    assert not clone.git.status("--porcelain")
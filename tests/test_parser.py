@@ -0,0 +1,207 @@
+"""Test the parsing and caching of analysis results."""
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Self
+
+import pytest
+
+from codesectools.sasts.core.parser import AnalysisResult, Defect
+from codesectools.sasts.core.parser.format.SARIF.parser import SARIFAnalysisResult
+from codesectools.shared.cwe import CWEs
+
+
+class ReportAnalysisResult(AnalysisResult):
+    """A minimal analysis result reading its duration and defects from a report.
+
+    The first line of the report is the duration, the next ones are the paths
+    of the files with a defect.
+    """
+
+    sast_name = "Report"
+    load_count = 0
+
+    @classmethod
+    def load_from_output_dir(cls, output_dir: Path) -> Self:
+        """Count the parsings and read the duration and defects from the report."""
+        cls.load_count += 1
+        time, *filepaths = (output_dir / "report.txt").read_text().splitlines()
+        defects = [
+            Defect(
+                sast_name=cls.sast_name,
+                filepath=Path(filepath),
+                checker="checker",
+                level="error",
+                cwe=CWEs.NOCWE,
+                message="",
+                lines=None,
+            )
+            for filepath in filepaths
+        ]
+        return cls(
+            name=output_dir.name,
+            source_path=output_dir,
+            lang="java",
+            defects=defects,
+            time=float(time),
+            lines_of_codes=0,
+        )
+
+
+@pytest.fixture
+def output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create an output directory with a report and its analysis info."""
+    monkeypatch.delenv("DEBUG", raising=False)
+    ReportAnalysisResult.load_count = 0
+
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    (output_dir / "codesectools.json").write_text(
+        json.dumps({"project_dir": str(project_dir)})
+    )
+    (output_dir / "report.txt").write_text("1.0")
+    return output_dir
+
+
+def test_cache_reused(output_dir: Path) -> None | AssertionError:
+    """Test that an unchanged output directory is parsed once."""
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    result = ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    assert ReportAnalysisResult.load_count == 1
+    assert result.time == 1.0
+
+
+def test_cache_touched_report(output_dir: Path) -> None | AssertionError:
+    """Test that touching a report invalidates the cache."""
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+
+    report = output_dir / "report.txt"
+    stat = report.stat()
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    assert ReportAnalysisResult.load_count == 2
+
+
+def test_cache_replaced_report(output_dir: Path) -> None | AssertionError:
+    """Test that replacing a report invalidates the cache."""
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+
+    new_report = output_dir / ".report.txt.new"
+    new_report.write_text("2.0")
+    os.replace(new_report, output_dir / "report.txt")
+    result = ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    assert ReportAnalysisResult.load_count == 2
+    assert result.time == 2.0
+
+
+def test_cache_replaced_project(output_dir: Path) -> None | AssertionError:
+    """Test that replacing the analyzed project invalidates the cache."""
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+
+    project_dir = output_dir.parent / "project"
+    project_dir.rename(output_dir.parent / "old-project")
+    project_dir.mkdir()
+    ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    assert ReportAnalysisResult.load_count == 2
+
+
+def test_removed_source(output_dir: Path) -> None | AssertionError:
+    """Test that a source removed since the last parsing is reported."""
+    source = output_dir.parent / "project" / "Main.java"
+    source.write_text("class Main {}")
+    (output_dir / "report.txt").write_text(f"1.0\n{source}")
+    result = ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+    assert len(result.defects) == 1
+
+    source.unlink()
+    with pytest.raises(FileNotFoundError):
+        ReportAnalysisResult.load_cached_from_output_dir(output_dir)
+
+
+def test_load_from_output_dirs(output_dir: Path) -> None | AssertionError:
+    """Test that cached and parsed results are returned in order."""
+    output_dirs = []
+    for index in range(4):
+        indexed_output_dir = output_dir.with_name(f"output{index}")
+        shutil.copytree(output_dir, indexed_output_dir)
+        (indexed_output_dir / "report.txt").write_text(f"{index}.0")
+        output_dirs.append(indexed_output_dir)
+    ReportAnalysisResult.load_cached_from_output_dir(output_dirs[1])
+
+    results = ReportAnalysisResult.load_from_output_dirs(output_dirs)
+    assert [result.time for result in results] == [0.0, 1.0, 2.0, 3.0]
+    assert all(
+        ReportAnalysisResult.get_cache_file(indexed_output_dir).is_file()
+        for indexed_output_dir in output_dirs
+    )
+
+
+def test_stats_invalidated(tmp_path: Path) -> None | AssertionError:
+    """Test that the statistics follow the defects and cannot be corrupted."""
+
+    def make_defects(*checkers: str) -> list[Defect]:
+        for checker in checkers:
+            (tmp_path / f"{checker}.java").touch()
+        return [
+            Defect(
+                sast_name=ReportAnalysisResult.sast_name,
+                filepath=tmp_path / f"{checker}.java",
+                checker=checker,
+                level="error",
+                cwe=CWEs.NOCWE,
+                message="",
+                lines=None,
+            )
+            for checker in checkers
+        ]
+
+    result = ReportAnalysisResult(
+        name="project",
+        source_path=tmp_path,
+        lang="java",
+        defects=make_defects("first", "second"),
+        time=0.0,
+        lines_of_codes=0,
+    )
+    result.stats_by_checkers().clear()
+    result.stats_by_files().pop(str(tmp_path / "first.java"))
+    assert set(result.stats_by_checkers()) == {"first", "second"}
+    assert len(result.stats_by_files()) == 2
+
+    # Replaced by as many defects
+    result.defects = make_defects("third", "fourth")
+    assert set(result.stats_by_checkers()) == {"third", "fourth"}
+    assert [Path(file).name for file in result.files] == ["third.java", "fourth.java"]
+
+    result.defects += make_defects("fifth")
+    assert result.stats_by_levels()["error"]["count"] == 3
+
+
+@pytest.mark.parametrize(
+    "tags",
+    [
+        [],
+        ["security"],
+        ["cwe-79"],
+        ["external/cwe/cwe-89"],
+        ["CWE-22: Improper Limitation of a Pathname"],
+        ["security", "OWASP-A03", "CWE-78"],
+        ["cwe-79abc"],
+        ["cwe-: unknown", "cwe-20"],
+        ["see cwe-xyz and cwe-502"],
+        ["cwe-89", "cwe-79"],
+    ],
+)
+def test_cwe_from_tags(tags: list[str]) -> None | AssertionError:
+    """Test that the CWE of the first tag referencing one is found."""
+    expected = CWEs.NOCWE
+    for tag in tags:
+        if m := re.search(r"cwe-(\d+)", tag.lower()):
+            expected = CWEs.from_id(int(m.group(1)))
+            break
+    assert SARIFAnalysisResult.cwe_from_tags(tags) == expected
@@ -0,0 +1,28 @@
+"""Test the shared helpers."""
+
+import pytest
+
+from codesectools.shared.cwe import CWEs
+
+
+@pytest.mark.parametrize(
+    ("cwe_string", "cwe_id"),
+    [
+        ("CWE-79", 79),
+        ("cwe-79", 79),
+        ("Cwe-79", 79),
+        ("CWE-78: Improper Neutralization", 78),
+        ("external/cwe/cwe-78", 78),
+        ("CWE79", None),
+        ("CWE-", None),
+        # Matched by the former [CWE|cwe]-(\d+) character class
+        ("e-79", None),
+        ("C-79", None),
+        ("|-79", None),
+        ("Issue-12", None),
+    ],
+)
+def test_cwe_from_string(cwe_string: str, cwe_id: int | None) -> None | AssertionError:
+    """Test that only strings referencing a CWE identifier are matched."""
+    expected = CWEs.NOCWE if cwe_id is None else CWEs.from_id(cwe_id)
+    assert CWEs.from_string(cwe_string) == expected
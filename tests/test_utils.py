@@ -0,0 +1,106 @@
+"""Test the utility functions."""
+
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from codesectools.utils import get_pattern, load_yaml_files, rmtree_in_background
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        "",
+        "--output",
+        "{lang}",
+        "--config={rules}/{lang}",
+        "prefix{a}suffix}",
+        "}{",
+        "{unclosed",
+        "{a\n}",
+        "{a\nb}",
+        "{a}\n{b}",
+        "{\n{a}",
+        "x\n{a}",
+    ],
+)
+def test_get_pattern(arg: str) -> None | AssertionError:
+    """Test that placeholders are found as with the original regex."""
+    m = re.search(r"\{.*\}", arg)
+    assert get_pattern(arg, {}) == (m.group() if m else None)
+
+
+def test_load_yaml_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None | AssertionError:
+    """Test that YAML files are parsed once and again when they change."""
+    monkeypatch.setattr("codesectools.utils.USER_CACHE_DIR", tmp_path / "cache")
+    tmp_path = tmp_path / "rules"
+    (tmp_path / "java").mkdir(parents=True)
+    rule = tmp_path / "java" / "rule.yml"
+    rule.write_text("id: first")
+    (tmp_path / "other.yaml").write_text("id: other")
+    (tmp_path / "multiple.yml").write_text("id: a\n---\nid: b")
+    (tmp_path / "README.md").write_text("id: readme")
+
+    assert load_yaml_files(tmp_path) == {
+        str(rule): {"id": "first"},
+        str(tmp_path / "other.yaml"): {"id": "other"},
+    }
+
+    # Unchanged files are not parsed again
+    with monkeypatch.context() as m:
+        m.setattr("yaml.load", None)
+        assert load_yaml_files(tmp_path)[str(rule)] == {"id": "first"}
+
+    rule.write_text("id: second")
+    stat = rule.stat()
+    os.utime(rule, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (tmp_path / "other.yaml").unlink()
+    assert load_yaml_files(tmp_path) == {str(rule): {"id": "second"}}
+
+
+def test_load_yaml_files_untrusted_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None | AssertionError:
+    """Test that no cache is read from or written to the directory tree."""
+    import pickle
+
+    monkeypatch.setattr("codesectools.utils.USER_CACHE_DIR", tmp_path / "cache")
+    directory = tmp_path / "rules"
+    directory.mkdir()
+    (directory / "rule.yml").write_text("id: rule")
+    # A cache shipped by the rules repository must never be unpickled
+    (directory / ".cstools_cache.pkl").write_bytes(
+        pickle.dumps({str(directory / "rule.yml"): ((0, 0), True, "forged")})
+    )
+    monkeypatch.setattr("pickle.load", None)
+
+    assert load_yaml_files(directory) == {str(directory / "rule.yml"): {"id": "rule"}}
+    assert {path.name for path in directory.iterdir()} == {
+        ".cstools_cache.pkl",
+        "rule.yml",
+    }
+    assert len(list((tmp_path / "cache" / "yaml").iterdir())) == 1
+
+
+def test_rmtree_in_background(tmp_path: Path) -> None | AssertionError:
+    """Test that a directory is removed and its path can be reused at once."""
+    directory = tmp_path / "directory"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "nested" / "file").write_text("content")
+
+    rmtree_in_background(directory)
+    assert not directory.exists()
+    directory.mkdir()
+
+    deadline = time.monotonic() + 10
+    while len(list(tmp_path.iterdir())) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert list(tmp_path.iterdir()) == [directory]
+
+    # Nothing to remove
+    rmtree_in_background(tmp_path / "missing")